@@ -0,0 +1,95 @@
+import importlib
+
+# nba_api has ~100 endpoint modules and `from nba_api.stats.endpoints import *` imports every one of them (and their pandas /
+# parameter machinery) when the server boots, even though a conversation only touches a few. Each name below is a stand-in
+# with the same call surface (e.g. boxscoreadvancedv3.BoxScoreAdvancedV3(...)) that imports the real module on first use.
+
+class _LazyEndpoint:
+    """Proxy for an nba_api.stats.endpoints module; the module is imported the first time an attribute is looked up."""
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(f"nba_api.stats.endpoints.{self._name}")
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return f"<lazy nba_api endpoint {self._name}>"
+
+
+alltimeleadersgrids = _LazyEndpoint("alltimeleadersgrids")
+assistleaders = _LazyEndpoint("assistleaders")
+assisttracker = _LazyEndpoint("assisttracker")
+boxscoreadvancedv3 = _LazyEndpoint("boxscoreadvancedv3")
+boxscoredefensivev2 = _LazyEndpoint("boxscoredefensivev2")
+boxscorefourfactorsv3 = _LazyEndpoint("boxscorefourfactorsv3")
+boxscorehustlev2 = _LazyEndpoint("boxscorehustlev2")
+boxscorematchupsv3 = _LazyEndpoint("boxscorematchupsv3")
+boxscoremiscv3 = _LazyEndpoint("boxscoremiscv3")
+boxscoreplayertrackv3 = _LazyEndpoint("boxscoreplayertrackv3")
+boxscorescoringv3 = _LazyEndpoint("boxscorescoringv3")
+boxscoretraditionalv3 = _LazyEndpoint("boxscoretraditionalv3")
+boxscoreusagev3 = _LazyEndpoint("boxscoreusagev3")
+commonallplayers = _LazyEndpoint("commonallplayers")
+commonplayerinfo = _LazyEndpoint("commonplayerinfo")
+commonplayoffseries = _LazyEndpoint("commonplayoffseries")
+commonteamroster = _LazyEndpoint("commonteamroster")
+cumestatsplayer = _LazyEndpoint("cumestatsplayer")
+cumestatsteam = _LazyEndpoint("cumestatsteam")
+defensehub = _LazyEndpoint("defensehub")
+draftboard = _LazyEndpoint("draftboard")
+draftcombinedrillresults = _LazyEndpoint("draftcombinedrillresults")
+draftcombinenonstationaryshooting = _LazyEndpoint("draftcombinenonstationaryshooting")
+draftcombineplayeranthro = _LazyEndpoint("draftcombineplayeranthro")
+draftcombinespotshooting = _LazyEndpoint("draftcombinespotshooting")
+draftcombinestats = _LazyEndpoint("draftcombinestats")
+drafthistory = _LazyEndpoint("drafthistory")
+fantasywidget = _LazyEndpoint("fantasywidget")
+franchisehistory = _LazyEndpoint("franchisehistory")
+franchiseleaders = _LazyEndpoint("franchiseleaders")
+franchiseplayers = _LazyEndpoint("franchiseplayers")
+gamerotation = _LazyEndpoint("gamerotation")
+homepageleaders = _LazyEndpoint("homepageleaders")
+hustlestatsboxscore = _LazyEndpoint("hustlestatsboxscore")
+iststandings = _LazyEndpoint("iststandings")
+leaguedashlineups = _LazyEndpoint("leaguedashlineups")
+leaguedashplayerstats = _LazyEndpoint("leaguedashplayerstats")
+leaguedashteamclutch = _LazyEndpoint("leaguedashteamclutch")
+leaguedashteamstats = _LazyEndpoint("leaguedashteamstats")
+leaguegamefinder = _LazyEndpoint("leaguegamefinder")
+leaguehustlestatsplayer = _LazyEndpoint("leaguehustlestatsplayer")
+leaguehustlestatsteam = _LazyEndpoint("leaguehustlestatsteam")
+leagueleaders = _LazyEndpoint("leagueleaders")
+leaguestandings = _LazyEndpoint("leaguestandings")
+matchupsrollup = _LazyEndpoint("matchupsrollup")
+playbyplayv2 = _LazyEndpoint("playbyplayv2")
+playerawards = _LazyEndpoint("playerawards")
+playercareerstats = _LazyEndpoint("playercareerstats")
+playercompare = _LazyEndpoint("playercompare")
+playerdashboardbyclutch = _LazyEndpoint("playerdashboardbyclutch")
+playerdashboardbyshootingsplits = _LazyEndpoint("playerdashboardbyshootingsplits")
+playerestimatedmetrics = _LazyEndpoint("playerestimatedmetrics")
+playergamelog = _LazyEndpoint("playergamelog")
+playerprofilev2 = _LazyEndpoint("playerprofilev2")
+playervsplayer = _LazyEndpoint("playervsplayer")
+playoffpicture = _LazyEndpoint("playoffpicture")
+scheduleleaguev2 = _LazyEndpoint("scheduleleaguev2")
+scoreboardv2 = _LazyEndpoint("scoreboardv2")
+shotchartdetail = _LazyEndpoint("shotchartdetail")
+synergyplaytypes = _LazyEndpoint("synergyplaytypes")
+teamdashboardbyshootingsplits = _LazyEndpoint("teamdashboardbyshootingsplits")
+teamdashlineups = _LazyEndpoint("teamdashlineups")
+teamdetails = _LazyEndpoint("teamdetails")
+teamestimatedmetrics = _LazyEndpoint("teamestimatedmetrics")
+teamhistoricalleaders = _LazyEndpoint("teamhistoricalleaders")
+teaminfocommon = _LazyEndpoint("teaminfocommon")
+teamvsplayer = _LazyEndpoint("teamvsplayer")
+teamyearbyyearstats = _LazyEndpoint("teamyearbyyearstats")
+videoevents = _LazyEndpoint("videoevents")
+videostatus = _LazyEndpoint("videostatus")
+winprobabilitypbp = _LazyEndpoint("winprobabilitypbp")
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+# Markdown rendering for tool output. df.to_markdown() goes through tabulate, which formats and pads every cell in Python; the
+# model doesn't need the padding, so fast_md builds the same pipe table a column at a time with numpy string ops instead.
+
+def _escape(cells: np.ndarray) -> np.ndarray:
+    return np.char.replace(cells, "|", "\\|")
+
+def _column_cells(col: pd.Series) -> np.ndarray:
+    """Render one column to an array of cell strings. Missing values become empty cells."""
+    if col.dtype.kind == "f":
+        values = col.to_numpy(dtype=float)
+        finite = np.isfinite(values)
+        whole = finite & (values == np.round(values)) & (np.abs(values) < 1e15)
+        # ids and counts that came back as floats (because of a missing value somewhere) print as integers, everything else
+        # with tabulate's default 6 significant digits
+        cells = np.where(whole, np.char.mod("%d", np.where(whole, values, 0).astype(np.int64)), np.char.mod("%g", values))
+        return np.where(np.isnan(values), "", cells)
+    if col.dtype.kind in "iub" and not col.hasnans:
+        return col.to_numpy().astype(str)
+    # text columns repeat a lot (team names, positions, matchups, W/L), so render and escape each distinct value once and
+    # index the results back out by code. Missing values get code -1, which picks the "" appended at the end. Nullable
+    # integer/boolean columns (Int64, boolean) with missing values come through here too, so pd.NA isn't printed as "<NA>".
+    try:
+        codes, uniques = pd.factorize(col)
+    except TypeError: # unhashable cells (lists, dicts) can't be factorized, so render every cell
+        return np.where(col.isna().to_numpy(), "", _escape(col.astype(str).to_numpy(dtype=str)))
+    if len(uniques) == 0: # nothing but missing values (np.char can't work on an empty array)
+        return np.full(len(col), "", dtype=object)
+    cells = np.append(_escape(np.asarray(uniques, dtype=object).astype(str)), "")
+    return cells[codes]
+
+def fast_md(df: pd.DataFrame) -> str:
+    """Render df as a markdown pipe table, without the index (like df.to_markdown(index=False), minus the column padding)."""
+    header = "| " + " | ".join(str(c).replace("|", "\\|") for c in df.columns) + " |"
+    separator = "|" + "|".join("---" for _ in df.columns) + "|"
+    if df.empty:
+        return f"{header}\n{separator}"
+
+    lines = np.full(len(df), "|", dtype=object)
+    for _, col in df.items():
+        lines = lines + " " + _column_cells(col).astype(object) + " |"
+    return "\n".join([header, separator, *lines])
+
+def _cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        if value != value: # NaN
+            return ""
+        return str(int(value)) if value.is_integer() and abs(value) < 1e15 else f"{value:g}"
+    return str(value).replace("|", "\\|")
+
+def md_table(headers, rows) -> str:
+    """
+    Render a result set straight from nba_api's raw headers + rows (e.g. dataset.get_dict()) in the same format as fast_md,
+    for small tables where building a DataFrame first would cost more than the rendering itself.
+    """
+    lines = [
+        "| " + " | ".join(str(h).replace("|", "\\|") for h in headers) + " |",
+        "|" + "|".join("---" for _ in headers) + "|"
+    ]
+    lines += ["| " + " | ".join([_cell(v) for v in row]) + " |" for row in rows]
+    return "\n".join(lines)
@@ -1,13 +1,192 @@
 from mcp.server.fastmcp import FastMCP
 from typing import List, Sequence, Optional
 from enum import Enum
-
-from nba_api.stats.endpoints import *
+from types import MappingProxyType
+import inspect
+from functools import lru_cache, partial, wraps
+import asyncio
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TLRUCache, TTLCache
+
+from nba_mcp_server.endpoints import (
+    alltimeleadersgrids, assistleaders, assisttracker, boxscoreadvancedv3, boxscoredefensivev2, boxscorefourfactorsv3,
+    boxscorehustlev2, boxscorematchupsv3, boxscoremiscv3, boxscoreplayertrackv3, boxscorescoringv3, boxscoretraditionalv3,
+    boxscoreusagev3, commonallplayers, commonplayerinfo, commonplayoffseries, commonteamroster, cumestatsplayer,
+    cumestatsteam, defensehub, draftboard, draftcombinedrillresults, draftcombinenonstationaryshooting,
+    draftcombineplayeranthro, draftcombinespotshooting, draftcombinestats, drafthistory, fantasywidget, franchisehistory,
+    franchiseleaders, franchiseplayers, gamerotation, homepageleaders, hustlestatsboxscore, iststandings, leaguedashlineups,
+    leaguedashplayerstats, leaguedashteamclutch, leaguedashteamstats, leaguegamefinder, leaguehustlestatsplayer,
+    leaguehustlestatsteam, leagueleaders, leaguestandings, matchupsrollup, playbyplayv2, playerawards, playercareerstats,
+    playercompare, playerdashboardbyclutch, playerdashboardbyshootingsplits, playerestimatedmetrics, playergamelog,
+    playerprofilev2, playervsplayer, playoffpicture, scheduleleaguev2, scoreboardv2, shotchartdetail, synergyplaytypes,
+    teamdashboardbyshootingsplits, teamdashlineups, teamdetails, teamestimatedmetrics, teamhistoricalleaders,
+    teaminfocommon, teamvsplayer, teamyearbyyearstats, videoevents, videostatus, winprobabilitypbp
+)
 from nba_api.stats.static import players, teams
-import datetime
+import time
+from nba_mcp_server.nba_http import install_cache, response_ttl
+from nba_mcp_server.formatting import fast_md, md_table
+
+install_cache()
 
 mcp = FastMCP("nba-chat")
 
+# Tool outputs are memoized per tool on the (bound) arguments, so a model that asks for the same thing twice in a conversation
+# (or across conversations) skips both the stats.nba.com request and the markdown rendering. How long an output is reused
+# depends on the tool's category. Errors are never cached.
+TOOL_CACHE_TTL = 5 * 60
+LIVE_TOOL_CACHE_TTL = 60 # tagged 'live': scoreboards, play-by-play, box scores, standings, ...
+HISTORICAL_TOOL_CACHE_TTL = 24 * 60 * 60 # tagged 'historical'
+
+def _freeze(value):
+    """Make a tool argument hashable (the model can pass lists) so it can be part of a cache key."""
+    return tuple(_freeze(v) for v in value) if isinstance(value, (list, tuple)) else value
+
+# Accepted values for the enum-like arguments many tools share, across all the endpoints that take them (a given endpoint may
+# accept fewer). nba_tool checks them before any request: a typo would otherwise cost a stats.nba.com round trip that ends in
+# an HTTP 400, and a value in the wrong case ("regular season") is fixed up instead. A tool's own default is always let through.
+_ENUM_ARGS = MappingProxyType({
+    "season_type": ("Regular Season", "Playoffs", "Pre Season", "All Star", "PlayIn", "IST", "Post Season", "College Season"),
+    "per_mode": (
+        "PerGame", "Totals", "Per36", "Per40", "Per48", "PerMinute", "PerPossession", "PerPlay", "Per100Possessions",
+        "Per100Plays", "MinutesPer"
+    ),
+    "measure_type": ("Base", "Advanced", "Misc", "Four Factors", "Scoring", "Opponent", "Usage", "Defense")
+})
+_ENUM_LOOKUP = {arg: {value.lower(): value for value in values} for arg, values in _ENUM_ARGS.items()}
+
+def _check_enum_args(bound: inspect.BoundArguments, enum_defaults: dict, fallback_args: Sequence[str] = ()):
+    """
+    Replace enum-like arguments with their canonical spelling, in place. Raises ValueError for an unknown value, except for
+    the fallback_args, which the tool maps onto a default of its own.
+    """
+    for name, default in enum_defaults.items():
+        value = bound.arguments[name]
+        if value is None or value == default:
+            continue
+        canonical = _ENUM_LOOKUP[name].get(str(value).strip().lower())
+        if canonical is None:
+            if name in fallback_args:
+                continue
+            raise ValueError(f"Invalid {name} '{value}'. Must be one of: {', '.join(_ENUM_ARGS[name])}")
+        bound.arguments[name] = canonical
+
+def _check_game_id(bound: inspect.BoundArguments):
+    """
+    Normalize the game_id argument to nba_api's 10-digit form, in place (restoring the leading zeros that get dropped when
+    an id passes through a number). Raises ValueError for anything else, which stats.nba.com would only answer with an
+    error or a timeout.
+    """
+    game_id = str(bound.arguments["game_id"]).strip()
+    if not game_id.isdigit() or len(game_id) > 10:
+        raise ValueError(f"Invalid game_id '{game_id}'. Must be a 10-digit game ID like \"0021700807\" (see get_league_game_finder)")
+    bound.arguments["game_id"] = game_id.zfill(10)
+
+# nba_api is synchronous (requests under the hood) and a stats.nba.com round trip can take seconds, so tool bodies run on a
+# shared thread pool and the tools are exposed to FastMCP as async. Calls that arrive together (the client dispatches a
+# response's tool calls concurrently) then overlap instead of queueing behind each other on the event loop.
+_TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="nba-tool")
+
+def nba_tool(meta: dict, error: str = "Error", fallback_args: Sequence[str] = ()):
+    """
+    Register a stats tool with the MCP server (like mcp.tool). The tool runs off the event loop and its output is cached per
+    argument set. If it raises, the model gets back `error` (formatted with the tool's arguments) followed by the exception.
+    Enum-like arguments (see _ENUM_ARGS) and game_id are validated and normalized before the tool runs; an invalid one is
+    reported the same way. fallback_args names enum-like arguments the tool handles unknown values of itself.
+    """
+    categories = meta.get("category", [])
+    if "historical" in categories:
+        ttl = HISTORICAL_TOOL_CACHE_TTL
+    elif "live" in categories:
+        ttl = LIVE_TOOL_CACHE_TTL
+    else:
+        ttl = TOOL_CACHE_TTL
+
+    def decorator(fn):
+        cache = TTLCache(maxsize=128, ttl=ttl)
+        signature = inspect.signature(fn)
+        enum_defaults = {name: param.default for name, param in signature.parameters.items() if name in _ENUM_ARGS}
+        takes_game_id = "game_id" in signature.parameters
+
+        # wraps keeps the name, docstring and (via __wrapped__) the signature FastMCP builds the tool schema from
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            try:
+                if enum_defaults:
+                    _check_enum_args(bound, enum_defaults, fallback_args)
+                if takes_game_id:
+                    _check_game_id(bound)
+            except ValueError as e:
+                return f"{error.format(**bound.arguments)}: {e}"
+            key = tuple((name, _freeze(value)) for name, value in bound.arguments.items())
+            result = cache.get(key) # the cache is only touched from the event loop, so it needs no lock
+            if result is None:
+                loop = asyncio.get_running_loop()
+                try:
+                    result = await loop.run_in_executor(_TOOL_EXECUTOR, partial(fn, *bound.args, **bound.kwargs))
+                except Exception as e:
+                    message = f"{error.format(**bound.arguments)}: {str(e)}"
+                    if isinstance(e, (requests.Timeout, requests.ConnectionError)):
+                        # the session has already retried what's worth retrying right away; tell the model this one is
+                        # transient so it can try again later rather than give up on the question
+                        message += " (stats.nba.com didn't respond; this is usually temporary, so the same call can be retried)"
+                    return message
+                cache[key] = result
+            return result
+
+        return mcp.tool(meta=meta)(wrapper)
+    return decorator
+
+# Parsed endpoint responses, shared by all the tools. One request often backs several tool calls (the player and team views of
+# a box score, a name lookup and get_player_info, ...), and reusing the endpoint object skips both the HTTP cache read and
+# parsing the JSON again. An entry lives as long as the HTTP cache would keep the response, but the cache is bounded by the
+# total size of the response bodies it holds (an endpoint keeps its body plus the parsed rows, so its footprint scales with
+# that), so a few multi-MB game finder or play-by-play results push out older entries instead of piling up for days.
+# Anything evicted is still in the on-disk HTTP cache.
+RESPONSE_CACHE_SIZE = 32 * 1024 * 1024 # characters of response body
+
+def _response_size(endpoint) -> int:
+    response = getattr(endpoint, "nba_response", None)
+    return max(len(getattr(response, "_response", None) or ""), 1)
+
+_RESPONSE_CACHE = TLRUCache(
+    maxsize=RESPONSE_CACHE_SIZE,
+    ttu=lambda _key, endpoint, now: now + response_ttl(endpoint.endpoint, getattr(endpoint, "parameters", {})),
+    getsizeof=_response_size
+)
+_RESPONSE_CACHE_LOCK = threading.Lock() # tools run on _TOOL_EXECUTOR threads and cachetools caches aren't thread-safe
+# key -> lock held while that request is being made. The client dispatches a response's tool calls together, so the same
+# uncached endpoint is often asked for by several threads at once; the first one makes the request and the rest wait for it.
+_IN_FLIGHT = {}
+
+def _fetch(endpoint_cls, **kwargs):
+    """Request an nba_api endpoint (i.e. construct it), or return the cached instance for the same arguments."""
+    key = (endpoint_cls.__name__, *sorted((name, _freeze(value)) for name, value in kwargs.items()))
+    with _RESPONSE_CACHE_LOCK:
+        endpoint = _RESPONSE_CACHE.get(key)
+        if endpoint is not None:
+            return endpoint
+        request_lock = _IN_FLIGHT.setdefault(key, threading.Lock())
+    with request_lock:
+        with _RESPONSE_CACHE_LOCK:
+            endpoint = _RESPONSE_CACHE.get(key) # made by the thread we waited on
+        if endpoint is None:
+            try:
+                endpoint = endpoint_cls(**kwargs)
+            finally:
+                # cache and retire the key together, so a later caller either finds the endpoint or starts a new request.
+                # If this one failed, anyone still waiting makes it again themselves (errors aren't cached).
+                with _RESPONSE_CACHE_LOCK:
+                    if endpoint is not None and _response_size(endpoint) <= RESPONSE_CACHE_SIZE:
+                        _RESPONSE_CACHE[key] = endpoint
+                    if _IN_FLIGHT.get(key) is request_lock:
+                        del _IN_FLIGHT[key]
+    return endpoint
+
 class ToolCategory(str, Enum):
     player = "player"
     team = "team"
@@ -19,7 +198,7 @@ class ToolCategory(str, Enum):
     playoff = "playoff"
     season = "season"
     base = "base"
-ALLOWED = {c.value for c in ToolCategory if c != ToolCategory.base} # the llm has no need to ever request "base" tools since they're always included.
+ALLOWED = frozenset(c.value for c in ToolCategory if c != ToolCategory.base) # the llm has no need to ever request "base" tools since they're always included.
 
 @mcp.tool(meta={"category":["base"]})
 def get_tools_by_category(categories: List[str]) -> List[str]:
@@ -43,11 +222,38 @@ def get_tools_by_category(categories: List[str]) -> List[str]:
     if invalid:
         raise ValueError(f"Invalid categories: {sorted(invalid)}. Allowed: {sorted(ALLOWED)}")
     
-    result = list(requested | {"base"})
-    return sorted(result)
+    return sorted(requested | {"base"})
+
+# name (lowercased) -> id lookups, so the helpers below are a single dict probe rather than a scan over the static lists. The
+# team index is small enough to build at import; the player one (~5000 players) is built on first use.
+_TEAM_INDEX = {}
+_CITY_TEAMS = {}
+for _team in teams.get_teams():
+    _CITY_TEAMS.setdefault(_team["city"].lower(), []).append(_team["id"])
+    for _key in ("nickname", "abbreviation", "full_name"): # full_name last so it wins any collision
+        _TEAM_INDEX[_team[_key].lower()] = _team["id"]
+for _city, _ids in _CITY_TEAMS.items():
+    if len(_ids) == 1: # "boston" is the Celtics, but "los angeles" could be either team, so it isn't indexed
+        _TEAM_INDEX.setdefault(_city, _ids[0])
+del _CITY_TEAMS
+_PLAYER_FULLNAME_INDEX = None
 
 def find_player_id(player_name: str) -> Optional[int]:
     """Helper function to find player ID by name."""
+    return _find_player_id(player_name.lower().strip())
+
+@lru_cache(maxsize=4096)
+def _find_player_id(player_name: str) -> Optional[int]:
+    # memoized on the normalized name, so repeat lookups of a name that needed the regex fallback are cheap too
+    global _PLAYER_FULLNAME_INDEX
+    if _PLAYER_FULLNAME_INDEX is None:
+        _PLAYER_FULLNAME_INDEX = {}
+        for player in players.get_players():
+            _PLAYER_FULLNAME_INDEX.setdefault(player['full_name'].lower(), player['id'])
+    player_id = _PLAYER_FULLNAME_INDEX.get(player_name)
+    if player_id is not None:
+        return player_id
+    # no exact match, fall back to nba_api's partial/regex name search
     players_found = players.find_players_by_full_name(player_name)
     if not players_found:
         return None
@@ -56,38 +262,87 @@ def find_player_id(player_name: str) -> Optional[int]:
 
 def find_team_id(team_name: str) -> Optional[int]:
     """Helper function to find team ID by name or abbreviation."""
-    all_teams = teams.get_teams()
-    for team in all_teams:
-        if (team_name.lower() == team['full_name'].lower() or 
-            team_name.lower() == team['abbreviation'].lower() or
-            team_name.lower() == team['nickname'].lower()):
-            return team['id']
-    return None
+    return _TEAM_INDEX.get(team_name.lower().strip())
+
 
+_season_cache = [0.0, ""] # [time computed, season]
 
 def get_current_season() -> str:
     """Helper function to get current NBA season in format YYYY-YY."""
-    today = datetime.date.today()
-    year = today.year
-    if today.month >= 10:
-        return f"{year}-{str(year + 1)[-2:]}"
-    else:
-        return f"{year - 1}-{str(year)[-2:]}"
+    # recomputed at most once an hour (so a long-running server still rolls over to the new season), otherwise it's one
+    # time.time() call and a compare
+    now = time.time()
+    if now - _season_cache[0] < 3600:
+        return _season_cache[1]
+    today = time.localtime(now)
+    start_year = today.tm_year - (today.tm_mon < 10) # seasons start in October
+    season = f"{start_year}-{(start_year + 1) % 100:02d}"
+    _season_cache[:] = [now, season]
+    return season
     
 
 
-@mcp.tool(meta = {"category": ['player']})
+def _first_value(dataset, column: str):
+    """Read one cell (first row) straight from an nba_api dataset's parsed rows, without building a DataFrame for it."""
+    table = dataset.get_dict()
+    return table["data"][0][table["headers"].index(column)]
+
+
+def _dataset_md(dataset) -> str:
+    """
+    Render an nba_api dataset from its parsed rows with md_table. For the small tables (a team's background, a roster,
+    a leader list) this is cheaper than building a DataFrame just to render it.
+    """
+    table = dataset.get_dict()
+    return md_table(table["headers"], table["data"])
+
+# Some tables (a season's worth of games, every player in the league, a full play-by-play) run to hundreds of rows. Tools
+# that can return those take a row limit, so the model gets the top of the table and is told how to ask for more.
+DEFAULT_ROW_LIMIT = 200
+
+def _limit_rows(rows, limit: Optional[int]):
+    """
+    rows (a DataFrame or a list of raw rows) cut to the first `limit`, and the note to append to the output (empty if
+    nothing was cut).
+    """
+    if limit and len(rows) > limit:
+        return rows[:limit], f"\n\n_Showing {limit} of {len(rows)} rows. Pass a larger limit for more._"
+    return rows, ""
+
+
+@nba_tool(meta={"category": ['player']})
 def get_player_name_from_id(player_id: str) -> str:
     """Get player name from player_id."""
-    return commonplayerinfo.CommonPlayerInfo(player_id=player_id).common_player_info.get_data_frame().DISPLAY_FIRST_LAST.values[0]
+    return _first_value(_fetch(commonplayerinfo.CommonPlayerInfo, player_id=player_id).common_player_info, "DISPLAY_FIRST_LAST")
 
-@mcp.tool(meta={"category": ['team']})
+@nba_tool(meta={"category": ['team']})
 def get_team_name_from_id(team_id: str) -> str:
     """Get team name from team_id."""
-    return teamdetails.TeamDetails(team_id=team_id).team_background.get_data_frame().ABBREVIATION.values[0]
-
-
-@mcp.tool(meta={"category": ['league', 'historical']})
+    return _first_value(_fetch(teamdetails.TeamDetails, team_id=team_id).team_background, "ABBREVIATION")
+
+
+# get_all_time_leaders: user-friendly stat category -> (AllTimeLeadersGrids dataset attribute, display name)
+_ALL_TIME_LEADER_CATEGORIES = MappingProxyType({
+    "points": ("pts_leaders", "Points"),
+    "assists": ("ast_leaders", "Assists"),
+    "rebounds": ("reb_leaders", "Rebounds"),
+    "blocks": ("blk_leaders", "Blocks"),
+    "steals": ("stl_leaders", "Steals"),
+    "turnovers": ("tov_leaders", "Turnovers"),
+    "field_goals": ("fgm_leaders", "Field Goals Made"),
+    "field_goal_pct": ("fg_pct_leaders", "Field Goal %"),
+    "threes": ("fg3m_leaders", "3-Point Field Goals"),
+    "three_pct": ("fg3_pct_leaders", "3-Point %"),
+    "free_throws": ("ftm_leaders", "Free Throws Made"),
+    "free_throw_pct": ("ft_pct_leaders", "Free Throw %"),
+    "offensive_rebounds": ("oreb_leaders", "Offensive Rebounds"),
+    "defensive_rebounds": ("dreb_leaders", "Defensive Rebounds"),
+    "fouls": ("pf_leaders", "Personal Fouls"),
+    "games": ("gp_leaders", "Games Played")
+})
+_VALID_ALL_TIME_LEADER_CATEGORIES = frozenset(_ALL_TIME_LEADER_CATEGORIES)
+
+@nba_tool(meta={"category": ['league', 'historical']}, error="Error retrieving all-time leaders")
 def get_all_time_leaders(
     per_mode: str = "Totals",
     season_type: str = "Regular Season",
@@ -109,63 +364,35 @@ def get_all_time_leaders(
                                 "offensive_rebounds", "defensive_rebounds", "fouls", "games"
                         If None, returns points, assists, and rebounds.
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
     # Default to current behavior if no categories specified
     if stat_categories is None:
         stat_categories = ["points", "assists", "rebounds"]
     
-    # Map user-friendly names to data object attributes
-    category_mapping = {
-        "points": ("pts_leaders", "Points"),
-        "assists": ("ast_leaders", "Assists"), 
-        "rebounds": ("reb_leaders", "Rebounds"),
-        "blocks": ("blk_leaders", "Blocks"),
-        "steals": ("stl_leaders", "Steals"),
-        "turnovers": ("tov_leaders", "Turnovers"),
-        "field_goals": ("fgm_leaders", "Field Goals Made"),
-        "field_goal_pct": ("fg_pct_leaders", "Field Goal %"),
-        "threes": ("fg3m_leaders", "3-Point Field Goals"),
-        "three_pct": ("fg3_pct_leaders", "3-Point %"),
-        "free_throws": ("ftm_leaders", "Free Throws Made"),
-        "free_throw_pct": ("ft_pct_leaders", "Free Throw %"),
-        "offensive_rebounds": ("oreb_leaders", "Offensive Rebounds"),
-        "defensive_rebounds": ("dreb_leaders", "Defensive Rebounds"),
-        "fouls": ("pf_leaders", "Personal Fouls"),
-        "games": ("gp_leaders", "Games Played")
-    }
-    
     # Validate categories
-    invalid_categories = [cat for cat in stat_categories if cat not in category_mapping]
+    invalid_categories = [cat for cat in stat_categories if cat not in _VALID_ALL_TIME_LEADER_CATEGORIES]
     if invalid_categories:
-        return f"Invalid stat categories: {', '.join(invalid_categories)}. Valid options: {', '.join(category_mapping.keys())}"
+        return f"Invalid stat categories: {', '.join(invalid_categories)}. Valid options: {', '.join(_ALL_TIME_LEADER_CATEGORIES)}"
     
-    try:
-        data = alltimeleadersgrids.AllTimeLeadersGrids(
-            league_id="00",
-            per_mode_simple=per_mode,
-            season_type=season_type,
-            topx=top_x
-        )
+    data = _fetch(alltimeleadersgrids.AllTimeLeadersGrids,
+        league_id="00",
+        per_mode_simple=per_mode,
+        season_type=season_type,
+        topx=top_x
+    )
         
-        result = f"# All-Time Leaders\n\n"
-        result += f"*Per Mode: {per_mode} | Season Type: {season_type}*\n\n"
+    parts = [f"# All-Time Leaders\n\n", f"*Per Mode: {per_mode} | Season Type: {season_type}*\n\n"]
         
-        for category in stat_categories:
-            attr_name, display_name = category_mapping[category]
-            df = getattr(data, attr_name).get_data_frame()
-            result += f"## {display_name}\n"
-            result += df.to_markdown(index=False) + "\n\n"
+    for category in stat_categories:
+        attr_name, display_name = _ALL_TIME_LEADER_CATEGORIES[category]
+        parts += [f"## {display_name}\n", _dataset_md(getattr(data, attr_name)), "\n\n"]
         
-        return result
+    return "".join(parts)
         
-    except Exception as e:
-        return f"Error retrieving all-time leaders: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['league', 'statistics']})
+@nba_tool(meta={"category": ['league', 'statistics']}, error="Error retrieving assist leaders")
 def get_assist_leaders(
     season: Optional[str] = None,
     per_mode: str = "Totals",
@@ -181,30 +408,24 @@ def get_assist_leaders(
         player_or_team: "Player" or "Team".
         season_type: "Regular Season", "Playoffs", "Pre Season".
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if season is None:
-            season = get_current_season()
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
             
-        data = assistleaders.AssistLeaders(
-            league_id="00",
-            per_mode_simple=per_mode,
-            player_or_team=player_or_team,
-            season=season,
-            season_type_playoffs=season_type
-        )
+    data = _fetch(assistleaders.AssistLeaders,
+        league_id="00",
+        per_mode_simple=per_mode,
+        player_or_team=player_or_team,
+        season=season,
+        season_type_playoffs=season_type
+    )
         
-        df = data.assist_leaders.get_data_frame()
-        return f"# Assist Leaders - {season} ({season_type})\n\n" + df.to_markdown(index=False)
+    df = data.assist_leaders.get_data_frame()
+    return f"# Assist Leaders - {season} ({season_type})\n\n" + fast_md(df)
         
-    except Exception as e:
-        return f"Error retrieving assist leaders: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['league', 'statistics', 'tracking']})
+@nba_tool(meta={"category": ['league', 'statistics', 'tracking']}, error="Error retrieving assist tracker data")
 def get_assist_tracker(
     season: Optional[str] = None,
     team_name: Optional[str] = None,
@@ -269,61 +490,153 @@ def get_assist_tracker(
         po_round: Playoff round.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        team_id = None
-        if team_name:
-            team_id = find_team_id(team_name)
-            if team_id is None:
-                return f"Team '{team_name}' not found. Check spelling."
-        
-        opponent_team_id = None
-        if opponent_team_name:
-            opponent_team_id = find_team_id(opponent_team_name)
-            if opponent_team_id is None:
-                return f"Opponent team '{opponent_team_name}' not found. Check spelling."
-        
-        data = assisttracker.AssistTracker(
-            season_nullable=season or "",
-            team_id_nullable=str(team_id) if team_id else "",
-            opponent_team_id_nullable=str(opponent_team_id) if opponent_team_id else "",
-            season_type_all_star_nullable=season_type or "",
-            date_from_nullable=date_from or "",
-            date_to_nullable=date_to or "",
-            per_mode_simple_nullable=per_mode or "",
-            location_nullable=location or "",
-            outcome_nullable=outcome or "",
-            conference_nullable=conference or "",
-            division_simple_nullable=division or "",
-            vs_conference_nullable=vs_conference or "",
-            vs_division_nullable=vs_division or "",
-            player_position_abbreviation_nullable=player_position or "",
-            player_experience_nullable=player_experience or "",
-            starter_bench_nullable=starter_bench or "",
-            college_nullable=college or "",
-            country_nullable=country or "",
-            draft_year_nullable=draft_year or "",
-            draft_pick_nullable=draft_pick or "",
-            height_nullable=height or "",
-            weight_nullable=weight or "",
-            game_scope_simple_nullable=game_scope or "",
-            last_n_games_nullable=last_n_games or "",
-            month_nullable=month or "",
-            season_segment_nullable=season_segment or "",
-            po_round_nullable=po_round or "",
-            league_id_nullable=""
-        )
-        
-        df = data.assist_tracker.get_data_frame()
-        return f"# Assist Tracker\n\n" + df.to_markdown(index=False)
-        
-    except Exception as e:
-        return f"Error retrieving assist tracker data: {str(e)}"
-
-@mcp.tool(meta={"category": ['boxscore', 'game', 'advanced']})
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    team_id = None
+    if team_name:
+        team_id = find_team_id(team_name)
+        if team_id is None:
+            return f"Team '{team_name}' not found. Check spelling."
+        
+    opponent_team_id = None
+    if opponent_team_name:
+        opponent_team_id = find_team_id(opponent_team_name)
+        if opponent_team_id is None:
+            return f"Opponent team '{opponent_team_name}' not found. Check spelling."
+        
+    data = _fetch(assisttracker.AssistTracker,
+        season_nullable=season or "",
+        team_id_nullable=str(team_id) if team_id else "",
+        opponent_team_id_nullable=str(opponent_team_id) if opponent_team_id else "",
+        season_type_all_star_nullable=season_type or "",
+        date_from_nullable=date_from or "",
+        date_to_nullable=date_to or "",
+        per_mode_simple_nullable=per_mode or "",
+        location_nullable=location or "",
+        outcome_nullable=outcome or "",
+        conference_nullable=conference or "",
+        division_simple_nullable=division or "",
+        vs_conference_nullable=vs_conference or "",
+        vs_division_nullable=vs_division or "",
+        player_position_abbreviation_nullable=player_position or "",
+        player_experience_nullable=player_experience or "",
+        starter_bench_nullable=starter_bench or "",
+        college_nullable=college or "",
+        country_nullable=country or "",
+        draft_year_nullable=draft_year or "",
+        draft_pick_nullable=draft_pick or "",
+        height_nullable=height or "",
+        weight_nullable=weight or "",
+        game_scope_simple_nullable=game_scope or "",
+        last_n_games_nullable=last_n_games or "",
+        month_nullable=month or "",
+        season_segment_nullable=season_segment or "",
+        po_round_nullable=po_round or "",
+        league_id_nullable=""
+    )
+        
+    df = data.assist_tracker.get_data_frame()
+    return f"# Assist Tracker\n\n" + fast_md(df)
+        
+
+# The box score endpoints return a dozen or so bookkeeping columns (ids, slugs, city, jersey number, ...) alongside the stats.
+# We trim each frame down to a few identifying columns plus the stats listed in the tool's docstring, which is what the model
+# was told it gets anyway; this roughly halves the table we render and send back. Scoring v3 isn't listed: its docstring names
+# don't match the endpoint's columns.
+_BOXSCORE_ID_COLS = [
+    "teamTricode", "personId", "firstName", "familyName", "position", "comment",
+    "firstNameOff", "familyNameOff", "firstNameDef", "familyNameDef" # matchups pair an offensive and a defensive player
+]
+_BOXSCORE_COLS = {
+    "advanced_v3": [
+        "minutes", "estimatedOffensiveRating", "offensiveRating", "estimatedDefensiveRating", "defensiveRating",
+        "estimatedNetRating", "netRating", "assistPercentage", "assistToTurnover", "assistRatio",
+        "offensiveReboundPercentage", "defensiveReboundPercentage", "reboundPercentage", "turnoverRatio",
+        "effectiveFieldGoalPercentage", "trueShootingPercentage", "usagePercentage", "estimatedUsagePercentage",
+        "estimatedPace", "pace", "pacePer40", "possessions", "PIE"
+    ],
+    "defensive_v2": [
+        "matchupMinutes", "partialPossessions", "switchesOn", "playerPoints", "defensiveRebounds", "matchupAssists",
+        "matchupTurnovers", "steals", "blocks", "matchupFieldGoalsMade", "matchupFieldGoalsAttempted",
+        "matchupFieldGoalPercentage", "matchupThreePointersMade", "matchupThreePointersAttempted",
+        "matchupThreePointerPercentage"
+    ],
+    "four_factors_v3": [
+        "minutes", "effectiveFieldGoalPercentage", "freeThrowAttemptRate", "teamTurnoverPercentage",
+        "offensiveReboundPercentage", "oppEffectiveFieldGoalPercentage", "oppFreeThrowAttemptRate",
+        "oppTeamTurnoverPercentage", "oppOffensiveReboundPercentage"
+    ],
+    "hustle_v2": [
+        "minutes", "points", "contestedShots", "contestedShots2pt", "contestedShots3pt", "deflections", "chargesDrawn",
+        "screenAssists", "screenAssistPoints", "looseBallsRecoveredOffensive", "looseBallsRecoveredDefensive",
+        "looseBallsRecoveredTotal", "offensiveBoxOuts", "defensiveBoxOuts", "boxOutPlayerTeamRebounds",
+        "boxOutPlayerRebounds", "boxOuts"
+    ],
+    "matchups_v3": [
+        "matchupMinutes", "matchupMinutesSort", "partialPossessions", "percentageDefenderTotalTime",
+        "percentageOffensiveTotalTime", "percentageTotalTimeBothOn", "switchesOn", "playerPoints", "teamPoints",
+        "matchupAssists", "matchupPotentialAssists", "matchupTurnovers", "matchupBlocks", "matchupFieldGoalsMade",
+        "matchupFieldGoalsAttempted", "matchupFieldGoalsPercentage", "matchupThreePointersMade",
+        "matchupThreePointersAttempted", "matchupThreePointersPercentage", "helpBlocks", "helpFieldGoalsMade",
+        "helpFieldGoalsAttempted", "helpFieldGoalsPercentage", "matchupFreeThrowsMade", "matchupFreeThrowsAttempted",
+        "shootingFouls"
+    ],
+    "misc_v3": [
+        "minutes", "pointsOffTurnovers", "pointsSecondChance", "pointsFastBreak", "pointsPaint",
+        "oppPointsOffTurnovers", "oppPointsSecondChance", "oppPointsFastBreak", "oppPointsPaint", "blocks",
+        "blocksAgainst", "foulsPersonal", "foulsDrawn"
+    ],
+    "player_track_v3": [
+        "minutes", "speed", "distance", "reboundChancesOffensive", "reboundChancesDefensive", "reboundChancesTotal",
+        "touches", "secondaryAssists", "freeThrowAssists", "passes", "assists", "contestedFieldGoalsMade",
+        "contestedFieldGoalsAttempted", "contestedFieldGoalPercentage", "uncontestedFieldGoalsMade",
+        "uncontestedFieldGoalsAttempted", "uncontestedFieldGoalsPercentage", "fieldGoalPercentage",
+        "defendedAtRimFieldGoalsMade", "defendedAtRimFieldGoalsAttempted", "defendedAtRimFieldGoalPercentage"
+    ],
+    "traditional_v3": [
+        "minutes", "fieldGoalsMade", "fieldGoalsAttempted", "fieldGoalsPercentage", "threePointersMade",
+        "threePointersAttempted", "threePointersPercentage", "freeThrowsMade", "freeThrowsAttempted",
+        "freeThrowsPercentage", "reboundsOffensive", "reboundsDefensive", "reboundsTotal", "assists", "steals",
+        "blocks", "turnovers", "foulsPersonal", "points", "plusMinusPoints"
+    ],
+    "usage_v3": [
+        "minutes", "usagePercentage", "percentageFieldGoalsMade", "percentageFieldGoalsAttempted",
+        "percentageThreePointersMade", "percentageThreePointersAttempted", "percentageFreeThrowsMade",
+        "percentageFreeThrowsAttempted", "percentageReboundsOffensive", "percentageReboundsDefensive",
+        "percentageReboundsTotal", "percentageAssists", "percentageTurnovers", "percentageSteals", "percentageBlocks",
+        "percentageBlocksAllowed", "percentagePersonalFouls", "percentagePersonalFoulsDrawn", "percentagePoints"
+    ],
+}
+
+def _boxscore_table(dataset, key: Optional[str] = None) -> str:
+    """
+    Render a box score dataset from its parsed rows, trimmed to its identifying columns + the documented _BOXSCORE_COLS[key]
+    stats (or in full if there's no key or those columns aren't there). A box score is a few dozen rows at most, so picking
+    columns out of the raw rows is cheaper than building a DataFrame to select them from.
+    """
+    table = dataset.get_dict()
+    headers, rows = table["headers"], table["data"]
+    if key is None:
+        return md_table(headers, rows)
+    position = {h: i for i, h in enumerate(headers)}
+    id_cols = [c for c in _BOXSCORE_ID_COLS if c in position]
+    stat_cols = [c for c in _BOXSCORE_COLS[key] if c in position]
+    if not id_cols or not stat_cols:
+        return md_table(headers, rows)
+    columns = id_cols + stat_cols
+    index = [position[c] for c in columns]
+    return md_table(columns, [[row[i] for i in index] for row in rows])
+
+def _boxscore_md(title: str, data, team_or_player: str, key: Optional[str] = None) -> str:
+    """Render the player ("P") or team side of a box score endpoint, trimmed to the _BOXSCORE_COLS[key] columns if given."""
+    if team_or_player == "P":
+        heading, dataset = "Player Stats", data.player_stats
+    else:
+        heading, dataset = "Team Stats", data.team_stats
+    return f"# {title}\n\n## {heading}\n{_boxscore_table(dataset, key)}\n\n"
+
+
+@nba_tool(meta={"category": ['boxscore', 'game', 'advanced', 'live']}, error="Error retrieving advanced box score v3")
 def get_boxscore_advanced_v3(
     game_id: str,
     team_or_player: str = "P"
@@ -342,32 +655,18 @@ def get_boxscore_advanced_v3(
         game_id: 10-digit game ID (e.g., "0021700807"). game_ids can be obtained using the get_league_game_finder tool call
         team_or_player: "P" for player stats, "T" for team stats (default "P").
     """
-    """
-    Hidden parameters:
-    None of these seem to do anything. I tested all variations I could think of with ints, strings, values, etc. to no effect.
-        start_period: Values map to quarter (1-4) or overtime (5-10)
-        end_period: Ending period (default 10 covers OT).
-        start_range: Range start (default 0).
-        end_range: Range end (default 0).
-        range_type: Range type (default 0).
-    """
-    try:
-        data = boxscoreadvancedv3.BoxScoreAdvancedV3(game_id=game_id)
+    # Hidden parameters:
+    # None of these seem to do anything. I tested all variations I could think of with ints, strings, values, etc. to no effect.
+    #     start_period: Values map to quarter (1-4) or overtime (5-10)
+    #     end_period: Ending period (default 10 covers OT).
+    #     start_range: Range start (default 0).
+    #     end_range: Range end (default 0).
+    #     range_type: Range type (default 0).
+    data = _fetch(boxscoreadvancedv3.BoxScoreAdvancedV3, game_id=game_id)
+    return _boxscore_md("Advanced Box Score", data, team_or_player, "advanced_v3")
         
-        result = f"# Advanced Box Score\n\n"
-        if team_or_player == "P":
-            result += "## Player Stats\n"
-            result += data.player_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        elif team_or_player == "T":
-            result += "## Team Stats\n"
-            result += data.team_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        
-        return result
-        
-    except Exception as e:
-        return f"Error retrieving advanced box score v3: {str(e)}"
 
-@mcp.tool(meta={"category": ['boxscore', 'game']})
+@nba_tool(meta={"category": ['boxscore', 'game', 'live']}, error="Error retrieving defensive box score")
 def get_boxscore_defensive_v2(
     game_id: str,
     team_or_player: str = "P"
@@ -384,24 +683,12 @@ def get_boxscore_defensive_v2(
         game_id: 10-digit game ID (e.g., "0021700807"). game_ids can be obtained using the get_league_game_finder tool call
         team_or_player: "P" for player stats, "T" for team stats (default "P").
     """
-    try:
-        data = boxscoredefensivev2.BoxScoreDefensiveV2(game_id=game_id)
-        
-        result = f"# Defensive Box Score\n\n"
-        if team_or_player == "P":
-            result += "## Player Stats\n"
-            result += data.player_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        elif team_or_player == "T":
-            result += "## Team Stats\n"
-            result += data.team_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        
-        return result
+    data = _fetch(boxscoredefensivev2.BoxScoreDefensiveV2, game_id=game_id)
+    return _boxscore_md("Defensive Box Score", data, team_or_player, "defensive_v2")
         
-    except Exception as e:
-        return f"Error retrieving defensive box score: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['boxscore', 'game']})
+@nba_tool(meta={"category": ['boxscore', 'game', 'live']}, error="Error retrieving four factors box score v3")
 def get_boxscore_four_factors_v3(
     game_id: str,
     team_or_player: str = "P",
@@ -417,27 +704,13 @@ def get_boxscore_four_factors_v3(
         game_id: 10-digit game ID (e.g., "0021700807"). game_ids can be obtained using the get_league_game_finder tool call
         team_or_player: "P" for player stats, "T" for team stats (default "P").
     """
-    """
-    Hidden parameters: see get_boxscores_advanced_v3
-    """
-    try:
-        data = boxscorefourfactorsv3.BoxScoreFourFactorsV3(game_id=game_id)
-        
-        result = f"# Four Factors Box Score V3\n\n"
-        if team_or_player == "P":
-            result += "## Player Stats\n"
-            result += data.player_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        else:
-            result += "## Team Stats\n"
-            result += data.team_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        
-        return result
+    # Hidden parameters: see get_boxscore_advanced_v3
+    data = _fetch(boxscorefourfactorsv3.BoxScoreFourFactorsV3, game_id=game_id)
+    return _boxscore_md("Four Factors Box Score V3", data, team_or_player, "four_factors_v3")
         
-    except Exception as e:
-        return f"Error retrieving four factors box score v3: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['boxscore', 'game']})
+@nba_tool(meta={"category": ['boxscore', 'game', 'live']}, error="Error retrieving hustle box score")
 def get_boxscore_hustle_v2(
     game_id: str,
     team_or_player: str = "P",
@@ -452,24 +725,12 @@ def get_boxscore_hustle_v2(
         game_id: 10-digit game ID (e.g., "0021700807"). game_ids can be obtained using the get_league_game_finder tool call
         team_or_player: "P" for player stats, "T" for team stats (default "P").
     """
-    try:
-        data = boxscorehustlev2.BoxScoreHustleV2(game_id=game_id)
-        
-        result = f"# Hustle Stats Box Score\n\n"
-        if team_or_player == "P":
-            result += "## Player Stats\n"
-            result += data.player_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        else:
-            result += "## Team Stats\n"
-            result += data.team_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        
-        return result
+    data = _fetch(boxscorehustlev2.BoxScoreHustleV2, game_id=game_id)
+    return _boxscore_md("Hustle Stats Box Score", data, team_or_player, "hustle_v2")
         
-    except Exception as e:
-        return f"Error retrieving hustle box score: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['boxscore', 'game']})
+@nba_tool(meta={"category": ['boxscore', 'game', 'live']}, error="Error retrieving matchups box score")
 def get_boxscore_matchups_v3(game_id: str) -> str:
     """
     Get player matchup data for a specific game (who guarded whom). Data returned includes:
@@ -482,19 +743,12 @@ def get_boxscore_matchups_v3(game_id: str) -> str:
     Args:
         game_id: 10-digit game ID (e.g., "0021700807"). Game IDs can be obtained using the get_league_game_finder tool.
     """
-    try:
-        data = boxscorematchupsv3.BoxScoreMatchupsV3(game_id=game_id)
-
-        result = f"# Matchups Box Score\n\n"
-        result += data.player_stats.get_data_frame().to_markdown(index=False) + "\n\n"
+    data = _fetch(boxscorematchupsv3.BoxScoreMatchupsV3, game_id=game_id)
+    return f"# Matchups Box Score\n\n{_boxscore_table(data.player_stats, 'matchups_v3')}\n\n"
 
-        return result
 
-    except Exception as e:
-        return f"Error retrieving matchups box score: {str(e)}"
 
-
-@mcp.tool(meta={"category": ['boxscore', 'game']})
+@nba_tool(meta={"category": ['boxscore', 'game', 'live']}, error="Error retrieving misc box score v3")
 def get_boxscore_misc_v3(
     game_id: str,
     team_or_player: str = "P",
@@ -511,24 +765,12 @@ def get_boxscore_misc_v3(
         game_id: 10-digit game ID (e.g., "0021700807"). game_ids can be obtained using the get_league_game_finder tool call
         team_or_player: "P" for player stats, "T" for team stats (default "P").
     """
-    try:
-        data = boxscoremiscv3.BoxScoreMiscV3(game_id=game_id)
-        
-        result = f"# Miscellaneous Box Score V3\n\n"
-        if team_or_player == "P":
-            result += "## Player Stats\n"
-            result += data.player_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        else:
-            result += "## Team Stats\n"
-            result += data.team_stats.get_data_frame().to_markdown(index=False) + "\n\n"
+    data = _fetch(boxscoremiscv3.BoxScoreMiscV3, game_id=game_id)
+    return _boxscore_md("Miscellaneous Box Score V3", data, team_or_player, "misc_v3")
         
-        return result
-        
-    except Exception as e:
-        return f"Error retrieving misc box score v3: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['boxscore', 'game', 'tracking']})
+@nba_tool(meta={"category": ['boxscore', 'game', 'tracking', 'live']}, error="Error retrieving player tracking box score v3")
 def get_boxscore_player_track_v3(
     game_id: str,
     team_or_player: str = "P",
@@ -546,23 +788,11 @@ def get_boxscore_player_track_v3(
         game_id: 10-digit game ID (e.g., "0021700807"). game_ids can be obtained using the get_league_game_finder tool call
         team_or_player: "P" for player stats, "T" for team stats (default "P").
     """
-    try:
-        data = boxscoreplayertrackv3.BoxScorePlayerTrackV3(game_id=game_id)
+    data = _fetch(boxscoreplayertrackv3.BoxScorePlayerTrackV3, game_id=game_id)
+    return _boxscore_md("Player Tracking Box Score V3", data, team_or_player, "player_track_v3")
         
-        result = f"# Player Tracking Box Score V3\n\n"
-        if team_or_player == "P":
-            result += "## Player Stats\n"
-            result += data.player_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        else:
-            result += "## Team Stats\n"
-            result += data.team_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        
-        return result
-        
-    except Exception as e:
-        return f"Error retrieving player tracking box score v3: {str(e)}"
 
-@mcp.tool(meta={"category": ['boxscore', 'game']})
+@nba_tool(meta={"category": ['boxscore', 'game', 'live']}, error="Error retrieving scoring box score v3")
 def get_boxscore_scoring_v3(
     game_id: str,
     team_or_player: str = "P",
@@ -578,24 +808,12 @@ def get_boxscore_scoring_v3(
         game_id: 10-digit game ID (e.g., "0021700807"). game_ids can be obtained using the get_league_game_finder tool call
         team_or_player: "P" for player stats, "T" for team stats (default "P").
     """
-    try:
-        data = boxscorescoringv3.BoxScoreScoringV3(game_id=game_id)
-        
-        result = f"# Scoring Box Score V3\n\n"
-        if team_or_player == "P":
-            result += "## Player Stats\n"
-            result += data.player_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        else:
-            result += "## Team Stats\n"
-            result += data.team_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        
-        return result
+    data = _fetch(boxscorescoringv3.BoxScoreScoringV3, game_id=game_id)
+    return _boxscore_md("Scoring Box Score V3", data, team_or_player)
         
-    except Exception as e:
-        return f"Error retrieving scoring box score v3: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['boxscore', 'game']})
+@nba_tool(meta={"category": ['boxscore', 'game', 'live']}, error="Error retrieving traditional box score v3")
 def get_boxscore_traditional_v3(
     game_id: str,
     team_or_player: str = "P",
@@ -612,24 +830,12 @@ def get_boxscore_traditional_v3(
         game_id: 10-digit game ID (e.g., "0021700807"). game_ids can be obtained using the get_league_game_finder tool call
         team_or_player: "P" for player stats, "T" for team stats (default "P").
     """
-    try:
-        data = boxscoretraditionalv3.BoxScoreTraditionalV3(game_id=game_id)
-        
-        result = f"# Traditional Box Score V3\n\n"
-        if team_or_player == "P":
-            result += "## Player Stats\n"
-            result += data.player_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        else:
-            result += "## Team Stats\n"
-            result += data.team_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        
-        return result
+    data = _fetch(boxscoretraditionalv3.BoxScoreTraditionalV3, game_id=game_id)
+    return _boxscore_md("Traditional Box Score V3", data, team_or_player, "traditional_v3")
         
-    except Exception as e:
-        return f"Error retrieving traditional box score v3: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['boxscore', 'game']})
+@nba_tool(meta={"category": ['boxscore', 'game', 'live']}, error="Error retrieving usage box score v3")
 def get_boxscore_usage_v3(
     game_id: str,
     team_or_player: str = "P",
@@ -647,24 +853,12 @@ def get_boxscore_usage_v3(
         game_id: 10-digit game ID (e.g., "0021700807"). game_ids can be obtained using the get_league_game_finder tool call
         team_or_player: "P" for player stats, "T" for team stats (default "P").
     """
-    try:
-        data = boxscoreusagev3.BoxScoreUsageV3(game_id=game_id)
-        
-        result = f"# Usage Box Score V3\n\n"
-        if team_or_player == "P":
-            result += "## Player Stats\n"
-            result += data.player_stats.get_data_frame().to_markdown(index=False) + "\n\n"
-        else:
-            result += "## Team Stats\n"
-            result += data.team_stats.get_data_frame().to_markdown(index=False) + "\n\n"
+    data = _fetch(boxscoreusagev3.BoxScoreUsageV3, game_id=game_id)
+    return _boxscore_md("Usage Box Score V3", data, team_or_player, "usage_v3")
         
-        return result
-        
-    except Exception as e:
-        return f"Error retrieving usage box score v3: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['player', 'league']})
+@nba_tool(meta={"category": ['player', 'league']}, error="Error retrieving all players")
 def get_all_players(
     season: Optional[str] = None,
     is_only_current_season: int = 0
@@ -677,28 +871,22 @@ def get_all_players(
         is_only_current_season: 1 for only current season roster, 0 for all historical.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if season is None:
-            season = get_current_season()
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
             
-        data = commonallplayers.CommonAllPlayers(
-            is_only_current_season=is_only_current_season,
-            league_id="00",
-            season=season
-        )
+    data = _fetch(commonallplayers.CommonAllPlayers,
+        is_only_current_season=is_only_current_season,
+        league_id="00",
+        season=season
+    )
         
-        df = data.common_all_players.get_data_frame()
-        return f"# All Players - {season}\n\n" + df.to_markdown(index=False)
+    df = data.common_all_players.get_data_frame()
+    return f"# All Players - {season}\n\n" + fast_md(df)
         
-    except Exception as e:
-        return f"Error retrieving all players: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['player']})
+@nba_tool(meta={"category": ['player']}, error="Error retrieving player info for {player_name}")
 def get_player_info(player_name: str) -> str:
     """
     Get detailed information about a specific player. Data includes:
@@ -715,30 +903,25 @@ def get_player_info(player_name: str) -> str:
         player_name: Player's full name (e.g., "LeBron James").
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        player_id = find_player_id(player_name)
-        if player_id is None:
-            return f"Player '{player_name}' not found. Check the exact name spelling."
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    player_id = find_player_id(player_name)
+    if player_id is None:
+        return f"Player '{player_name}' not found. Check the exact name spelling."
         
-        data = commonplayerinfo.CommonPlayerInfo(
-            player_id=player_id,
-            league_id_nullable=""
-        )
+    data = _fetch(commonplayerinfo.CommonPlayerInfo,
+        player_id=player_id,
+        league_id_nullable=""
+    )
         
-        result = f"# Player Info - {player_name}\n\n"
-        result += data.common_player_info.get_data_frame().to_markdown(index=False) + "\n\n"
+    parts = [f"# Player Info - {player_name}\n\n"]
+    parts += [fast_md(data.common_player_info.get_data_frame()), "\n\n"]
         
-        return result
+    return "".join(parts)
         
-    except Exception as e:
-        return f"Error retrieving player info for {player_name}: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['playoff']})
+@nba_tool(meta={"category": ['playoff']}, error="Error retrieving playoff series")
 def get_playoff_series(
     season: Optional[str] = None
 ) -> str:
@@ -750,27 +933,21 @@ def get_playoff_series(
         season: NBA season (e.g., "2023-24"). If None, uses current season.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if season is None:
-            season = get_current_season()
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
             
-        data = commonplayoffseries.CommonPlayoffSeries(
-            league_id="00",
-            season=season
-        )
+    data = _fetch(commonplayoffseries.CommonPlayoffSeries,
+        league_id="00",
+        season=season
+    )
         
-        df = data.playoff_series.get_data_frame()
-        return f"# Playoff Series - {season}\n\n" + df.to_markdown(index=False)
+    df = data.playoff_series.get_data_frame()
+    return f"# Playoff Series - {season}\n\n" + fast_md(df)
         
-    except Exception as e:
-        return f"Error retrieving playoff series: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['team']})
+@nba_tool(meta={"category": ['team']}, error="Error retrieving team roster for {team_name}")
 def get_team_roster(
     team_name: str,
     season: Optional[str] = None
@@ -785,37 +962,29 @@ def get_team_roster(
         season: NBA season (e.g., "2023-24"). If None, uses current season.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        team_id = find_team_id(team_name)
-        if team_id is None:
-            return f"Team '{team_name}' not found. Check spelling."
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    team_id = find_team_id(team_name)
+    if team_id is None:
+        return f"Team '{team_name}' not found. Check spelling."
         
-        if season is None:
-            season = get_current_season()
+    season = season or get_current_season()
         
-        data = commonteamroster.CommonTeamRoster(
-            team_id=team_id,
-            season=season,
-            league_id_nullable=""
-        )
+    data = _fetch(commonteamroster.CommonTeamRoster,
+        team_id=team_id,
+        season=season,
+        league_id_nullable=""
+    )
         
-        result = f"# Team Roster - {team_name} ({season})\n\n"
-        result += "## Players\n"
-        result += data.common_team_roster.get_data_frame().to_markdown(index=False) + "\n\n"
-        result += "## Coaches\n"
-        result += data.coaches.get_data_frame().to_markdown(index=False) + "\n\n"
+    parts = [f"# Team Roster - {team_name} ({season})\n\n"]
+    parts += ["## Players\n", _dataset_md(data.common_team_roster), "\n\n"]
+    parts += ["## Coaches\n", _dataset_md(data.coaches), "\n\n"]
         
-        return result
+    return "".join(parts)
         
-    except Exception as e:
-        return f"Error retrieving team roster for {team_name}: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['player', 'statistics']})
+@nba_tool(meta={"category": ['player', 'statistics']}, error="Error retrieving cumulative stats for {player_name}")
 def get_player_stats_by_game(
     player_name: str,
     game_id: str,
@@ -836,38 +1005,29 @@ def get_player_stats_by_game(
         season_type: "Regular Season", "Playoffs", "All Star", "Pre Season". Default: "Regular Season"
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        player_id = find_player_id(player_name)
-        if player_id is None:
-            return f"Player '{player_name}' not found."
-        
-        if season is None:
-            season = get_current_season()
-        
-        data = cumestatsplayer.CumeStatsPlayer(
-            player_id=player_id,
-            game_ids=[game_id],
-            season=season,
-            season_type_all_star=season_type,
-            league_id="00"
-        )
-        df = data.total_player_stats.get_data_frame()
-        if not len(df):
-            return f"No data found for player '{player_name}' in game {game_id}."
-        else:
-            result = f"# Player game Stats - {player_name}\n\n"
-            result += df.to_markdown(index=False) + "\n\n"
-                
-            return result
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    player_id = find_player_id(player_name)
+    if player_id is None:
+        return f"Player '{player_name}' not found."
+        
+    season = season or get_current_season()
+        
+    data = _fetch(cumestatsplayer.CumeStatsPlayer,
+        player_id=player_id,
+        game_ids=[game_id],
+        season=season,
+        season_type_all_star=season_type,
+        league_id="00"
+    )
+    df = data.total_player_stats.get_data_frame()
+    if not len(df):
+        return f"No data found for player '{player_name}' in game {game_id}."
+    else:
+        return f"# Player game Stats - {player_name}\n\n{fast_md(df)}\n\n"
         
-    except Exception as e:
-        return f"Error retrieving cumulative stats for {player_name}: {str(e)}"
 
-@mcp.tool(meta={"category": ['team', 'statistics']})
+@nba_tool(meta={"category": ['team', 'statistics']}, error="Error retrieving cumulative team stats for {team_name}")
 def get_cumulative_team_stats(
     team_name: str,
     game_id: str,
@@ -887,39 +1047,30 @@ def get_cumulative_team_stats(
         season_type: "Regular Season", "Playoffs", "All Star", "Pre Season". Default: "Regular Season"
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        team_id = find_team_id(team_name)
-        if team_id is None:
-            return f"Team '{team_name}' not found."
-        
-        if season is None:
-            season = get_current_season()
-        
-        data = cumestatsteam.CumeStatsTeam(
-            team_id=team_id,
-            game_ids=[game_id],
-            season=season,
-            season_type_all_star=season_type,
-            league_id="00"
-        )
-        df = data.total_team_stats.get_data_frame()
-        if not len(df):
-            return f"No data found for team '{team_name}' in game {game_id}."
-        else:
-            result = f"# Team Stats for game - {team_name}\n\n"
-            result += df.to_markdown(index=False) + "\n\n"
-            
-            return result
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    team_id = find_team_id(team_name)
+    if team_id is None:
+        return f"Team '{team_name}' not found."
+        
+    season = season or get_current_season()
+        
+    data = _fetch(cumestatsteam.CumeStatsTeam,
+        team_id=team_id,
+        game_ids=[game_id],
+        season=season,
+        season_type_all_star=season_type,
+        league_id="00"
+    )
+    df = data.total_team_stats.get_data_frame()
+    if not len(df):
+        return f"No data found for team '{team_name}' in game {game_id}."
+    else:
+        return f"# Team Stats for game - {team_name}\n\n{fast_md(df)}\n\n"
         
-    except Exception as e:
-        return f"Error retrieving cumulative team stats for {team_name}: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['league', 'statistics']})
+@nba_tool(meta={"category": ['league', 'statistics']}, error="Error retrieving defense hub")
 def get_defense_hub(
     season: Optional[str] = None,
     season_type: str = "Regular Season",
@@ -934,29 +1085,23 @@ def get_defense_hub(
         per_mode: "Totals", "PerGame", "Per36".
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if season is None:
-            season = get_current_season()
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
         
-        data = defensehub.DefenseHub(
-            season=season,
-            season_type_all_star=season_type,
-            per_mode_simple=per_mode,
-            league_id="00"
-        )
+    data = _fetch(defensehub.DefenseHub,
+        season=season,
+        season_type_all_star=season_type,
+        per_mode_simple=per_mode,
+        league_id="00"
+    )
         
-        df = data.defense_hub.get_data_frame()
-        return f"# Defense Hub - {season} ({season_type})\n\n" + df.to_markdown(index=False)
+    df = data.defense_hub.get_data_frame()
+    return f"# Defense Hub - {season} ({season_type})\n\n" + fast_md(df)
         
-    except Exception as e:
-        return f"Error retrieving defense hub: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['draft']})
+@nba_tool(meta={"category": ['draft']}, error="Error retrieving draft board")
 def get_draft_board(
     season: Optional[str] = None
 ) -> str:
@@ -967,27 +1112,21 @@ def get_draft_board(
         season: Draft year (e.g., "2023-24"). If None, uses current season.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if season is None:
-            season = get_current_season()
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
         
-        data = draftboard.DraftBoard(
-            season=season,
-            league_id="00"
-        )
+    data = _fetch(draftboard.DraftBoard,
+        season=season,
+        league_id="00"
+    )
         
-        df = data.draft_board.get_data_frame()
-        return f"# Draft Board - {season}\n\n" + df.to_markdown(index=False)
+    df = data.draft_board.get_data_frame()
+    return f"# Draft Board - {season}\n\n" + fast_md(df)
         
-    except Exception as e:
-        return f"Error retrieving draft board: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['draft', 'combine']})
+@nba_tool(meta={"category": ['draft', 'combine']}, error="Error retrieving draft combine drill results")
 def get_draft_combine_drill_results(season: Optional[str] = None) -> str:
     """
     Get NBA draft combine drill results (agility, sprint, etc.).
@@ -996,27 +1135,21 @@ def get_draft_combine_drill_results(season: Optional[str] = None) -> str:
         season: Draft year. If None, uses current season.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if season is None:
-            season = get_current_season()
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
         
-        data = draftcombinedrillresults.DraftCombineDrillResults(
-            season_year=season,
-            league_id="00"
-        )
+    data = _fetch(draftcombinedrillresults.DraftCombineDrillResults,
+        season_year=season,
+        league_id="00"
+    )
         
-        df = data.results.get_data_frame()
-        return f"# Draft Combine Drill Results - {season}\n\n" + df.to_markdown(index=False)
+    df = data.results.get_data_frame()
+    return f"# Draft Combine Drill Results - {season}\n\n" + fast_md(df)
         
-    except Exception as e:
-        return f"Error retrieving draft combine drill results: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['draft', 'combine']})
+@nba_tool(meta={"category": ['draft', 'combine']}, error="Error retrieving draft combine shooting")
 def get_draft_combine_shooting(season: Optional[str] = None) -> str:
     """
     Get NBA draft combine non-stationary shooting results.
@@ -1025,27 +1158,21 @@ def get_draft_combine_shooting(season: Optional[str] = None) -> str:
         season: Draft year. If None, uses current season.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if season is None:
-            season = get_current_season()
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
         
-        data = draftcombinenonstationaryshooting.DraftCombineNonStationaryShooting(
-            season_year=season,
-            league_id="00"
-        )
+    data = _fetch(draftcombinenonstationaryshooting.DraftCombineNonStationaryShooting,
+        season_year=season,
+        league_id="00"
+    )
         
-        df = data.results.get_data_frame()
-        return f"# Draft Combine Shooting - {season}\n\n" + df.to_markdown(index=False)
+    df = data.results.get_data_frame()
+    return f"# Draft Combine Shooting - {season}\n\n" + fast_md(df)
         
-    except Exception as e:
-        return f"Error retrieving draft combine shooting: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['draft', 'combine']})
+@nba_tool(meta={"category": ['draft', 'combine']}, error="Error retrieving draft combine measurements")
 def get_draft_combine_measurements(season: Optional[str] = None) -> str:
     """
     Get NBA draft combine player measurements (height, weight, wingspan, etc.).
@@ -1054,27 +1181,21 @@ def get_draft_combine_measurements(season: Optional[str] = None) -> str:
         season: Draft year. If None, uses current season.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if season is None:
-            season = get_current_season()
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
         
-        data = draftcombineplayeranthro.DraftCombinePlayerAnthro(
-            season_year=season,
-            league_id="00"
-        )
+    data = _fetch(draftcombineplayeranthro.DraftCombinePlayerAnthro,
+        season_year=season,
+        league_id="00"
+    )
         
-        df = data.results.get_data_frame()
-        return f"# Draft Combine Measurements - {season}\n\n" + df.to_markdown(index=False)
+    df = data.results.get_data_frame()
+    return f"# Draft Combine Measurements - {season}\n\n" + fast_md(df)
         
-    except Exception as e:
-        return f"Error retrieving draft combine measurements: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['draft', 'combine']})
+@nba_tool(meta={"category": ['draft', 'combine']}, error="Error retrieving draft combine spot shooting")
 def get_draft_combine_spot_shooting(season: Optional[str] = None) -> str:
     """
     Get NBA draft combine spot shooting results.
@@ -1083,27 +1204,21 @@ def get_draft_combine_spot_shooting(season: Optional[str] = None) -> str:
         season: Draft year. If None, uses current season.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if season is None:
-            season = get_current_season()
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
         
-        data = draftcombinespotshooting.DraftCombineSpotShooting(
-            season_year=season,
-            league_id="00"
-        )
+    data = _fetch(draftcombinespotshooting.DraftCombineSpotShooting,
+        season_year=season,
+        league_id="00"
+    )
         
-        df = data.results.get_data_frame()
-        return f"# Draft Combine Spot Shooting - {season}\n\n" + df.to_markdown(index=False)
+    df = data.results.get_data_frame()
+    return f"# Draft Combine Spot Shooting - {season}\n\n" + fast_md(df)
         
-    except Exception as e:
-        return f"Error retrieving draft combine spot shooting: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['draft', 'combine']})
+@nba_tool(meta={"category": ['draft', 'combine']}, error="Error retrieving draft combine stats")
 def get_draft_combine_stats(season: Optional[str] = None) -> str:
     """
     Get NBA draft combine overall statistics.
@@ -1112,27 +1227,21 @@ def get_draft_combine_stats(season: Optional[str] = None) -> str:
         season: Draft year. If None, uses current season.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if season is None:
-            season = get_current_season()
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
         
-        data = draftcombinestats.DraftCombineStats(
-            season_year=season,
-            league_id="00"
-        )
+    data = _fetch(draftcombinestats.DraftCombineStats,
+        season_year=season,
+        league_id="00"
+    )
         
-        df = data.results.get_data_frame()
-        return f"# Draft Combine Stats - {season}\n\n" + df.to_markdown(index=False)
+    df = data.results.get_data_frame()
+    return f"# Draft Combine Stats - {season}\n\n" + fast_md(df)
         
-    except Exception as e:
-        return f"Error retrieving draft combine stats: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['draft']})
+@nba_tool(meta={"category": ['draft']}, error="Error retrieving draft history")
 def get_draft_history(
     season: Optional[str] = None
 ) -> str:
@@ -1143,27 +1252,21 @@ def get_draft_history(
         season: Draft year. If None, uses current season.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if season is None:
-            season = get_current_season()
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
         
-        data = drafthistory.DraftHistory(
-            season=season,
-            league_id="00"
-        )
+    data = _fetch(drafthistory.DraftHistory,
+        season=season,
+        league_id="00"
+    )
         
-        df = data.draft_history.get_data_frame()
-        return f"# Draft History - {season}\n\n" + df.to_markdown(index=False)
+    df = data.draft_history.get_data_frame()
+    return f"# Draft History - {season}\n\n" + fast_md(df)
         
-    except Exception as e:
-        return f"Error retrieving draft history: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['other']})
+@nba_tool(meta={"category": ['other']}, error="Error retrieving fantasy widget")
 def get_fantasy_widget(
     season: Optional[str] = None,
     season_type: str = "Regular Season"
@@ -1176,28 +1279,22 @@ def get_fantasy_widget(
         season_type: "Regular Season", "Playoffs", etc.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if season is None:
-            season = get_current_season()
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
         
-        data = fantasywidget.FantasyWidget(
-            season=season,
-            season_type_all_star=season_type,
-            league_id="00"
-        )
+    data = _fetch(fantasywidget.FantasyWidget,
+        season=season,
+        season_type_all_star=season_type,
+        league_id="00"
+    )
         
-        df = data.fantasy_widget.get_data_frame()
-        return f"# Fantasy Widget - {season} ({season_type})\n\n" + df.to_markdown(index=False)
+    df = data.fantasy_widget.get_data_frame()
+    return f"# Fantasy Widget - {season} ({season_type})\n\n" + fast_md(df)
         
-    except Exception as e:
-        return f"Error retrieving fantasy widget: {str(e)}"
 
 
-@mcp.tool(meta={"category": ['franchise', 'team', 'historical']})
+@nba_tool(meta={"category": ['franchise', 'team', 'historical']}, error="Error retrieving franchise history for {team_name}")
 def get_franchise_history(team_name: str) -> str:
     """
     Get complete franchise history for a team.
@@ -1207,29 +1304,24 @@ def get_franchise_history(team_name: str) -> str:
         team_name: Team name or abbreviation (e.g., "Lakers" or "LAL")..
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        team_id = find_team_id(team_name)
-        if team_id is None:
-            return f"Team '{team_name}' not found."
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    team_id = find_team_id(team_name)
+    if team_id is None:
+        return f"Team '{team_name}' not found."
         
-        data = franchisehistory.FranchiseHistory(
-            team_id=team_id,
-            league_id="00"
-        )
+    data = _fetch(franchisehistory.FranchiseHistory,
+        team_id=team_id,
+        league_id="00"
+    )
         
-        df = data.franchise_history.get_data_frame()
-        return f"# Franchise History - {team_name}\n\n" + df.to_markdown(index=False)
+    df = data.franchise_history.get_data_frame()
+    return f"# Franchise History - {team_name}\n\n" + fast_md(df)
         
-    except Exception as e:
-        return f"Error retrieving franchise history for {team_name}: {str(e)}"
 
 
 
-@mcp.tool(meta={"category": ['franchise', 'team', 'historical']})
+@nba_tool(meta={"category": ['franchise', 'team', 'historical']})
 def get_franchise_leaders(team_name: str, per_mode: str = "PerGame") -> str:
     """
     Get franchise all-time leaders. Accepts team name.
@@ -1239,21 +1331,16 @@ def get_franchise_leaders(team_name: str, per_mode: str = "PerGame") -> str:
         per_mode: Per mode.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        team_id = find_team_id(team_name)
-        if not team_id:
-            return f"Team '{team_name}' not found."
-        data = franchiseleaders.FranchiseLeaders(team_id=team_id, league_id="00", per_mode_simple=per_mode)
-        return f"# Franchise Leaders - {team_name}\n\n" + data.franchise_leaders.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    team_id = find_team_id(team_name)
+    if not team_id:
+        return f"Team '{team_name}' not found."
+    data = _fetch(franchiseleaders.FranchiseLeaders, team_id=team_id, league_id="00", per_mode_simple=per_mode)
+    return f"# Franchise Leaders - {team_name}\n\n" + fast_md(data.franchise_leaders.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['franchise', 'team', 'historical']})
+@nba_tool(meta={"category": ['franchise', 'team', 'historical']})
 def get_franchise_players(team_name: str, per_mode: str = "PerGame") -> str:
     """
     Get all players in franchise history. Accepts team name.
@@ -1263,21 +1350,16 @@ def get_franchise_players(team_name: str, per_mode: str = "PerGame") -> str:
         per_mode: Per mode.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        team_id = find_team_id(team_name)
-        if not team_id:
-            return f"Team '{team_name}' not found."
-        data = franchiseplayers.FranchisePlayers(team_id=team_id, league_id="00", per_mode_simple=per_mode)
-        return f"# Franchise Players - {team_name}\n\n" + data.franchise_players.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    team_id = find_team_id(team_name)
+    if not team_id:
+        return f"Team '{team_name}' not found."
+    data = _fetch(franchiseplayers.FranchisePlayers, team_id=team_id, league_id="00", per_mode_simple=per_mode)
+    return f"# Franchise Players - {team_name}\n\n" + fast_md(data.franchise_players.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['game']})
+@nba_tool(meta={"category": ['game', 'live']})
 def get_game_rotation(game_id: str) -> str:
     """
     Get player rotation data for a game.
@@ -1286,21 +1368,16 @@ def get_game_rotation(game_id: str) -> str:
         game_id: Game ID.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        data = gamerotation.GameRotation(game_id=game_id, league_id="00")
-        result = f"# Game Rotation - {game_id}\n\n"
-        result += "## Home Team\n" + data.home_team.get_data_frame().to_markdown(index=False) + "\n\n"
-        result += "## Away Team\n" + data.away_team.get_data_frame().to_markdown(index=False) + "\n\n"
-        return result
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    data = _fetch(gamerotation.GameRotation, game_id=game_id, league_id="00")
+    parts = [f"# Game Rotation - {game_id}\n\n"]
+    parts += ["## Home Team\n", _dataset_md(data.home_team), "\n\n"]
+    parts += ["## Away Team\n", _dataset_md(data.away_team), "\n\n"]
+    return "".join(parts)
 
 
-@mcp.tool(meta={"category": ['league', 'statistics']})
+@nba_tool(meta={"category": ['league', 'statistics']})
 def get_homepage_leaders(
     season: Optional[str] = None,
     season_type: str = "Regular Season",
@@ -1319,23 +1396,17 @@ def get_homepage_leaders(
         player_scope: Player scope.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if not season:
-            season = get_current_season()
-        data = homepageleaders.HomePageLeaders(
-            season=season, season_type_all_star=season_type, league_id="00",
-            player_or_team=player_or_team, game_scope=game_scope, player_scope=player_scope
-        )
-        return f"# Homepage Leaders - {season}\n\n" + data.home_page_leaders.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool(meta={"category": ['season']})
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
+    data = _fetch(homepageleaders.HomePageLeaders,
+        season=season, season_type_all_star=season_type, league_id="00",
+        player_or_team=player_or_team, game_scope=game_scope, player_scope=player_scope
+    )
+    return f"# Homepage Leaders - {season}\n\n" + fast_md(data.home_page_leaders.get_data_frame())
+
+
+@nba_tool(meta={"category": ['season', 'live']})
 def get_ist_standings(season: Optional[str] = None, season_type: str = "IST") -> str:
     """
     Get In-Season Tournament standings.
@@ -1345,20 +1416,14 @@ def get_ist_standings(season: Optional[str] = None, season_type: str = "IST") ->
         season_type: Season type.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if not season:
-            season = get_current_season()
-        data = iststandings.ISTStandings(season_year=season, season_type=season_type, league_id="00")
-        return f"# IST Standings - {season}\n\n" + data.standings.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
+    data = _fetch(iststandings.ISTStandings, season_year=season, season_type=season_type, league_id="00")
+    return f"# IST Standings - {season}\n\n" + fast_md(data.standings.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['league', 'statistics']})
+@nba_tool(meta={"category": ['league', 'statistics']})
 def get_league_leaders(
     season: Optional[str] = None,
     season_type: str = "Regular Season",
@@ -1377,28 +1442,23 @@ def get_league_leaders(
         scope: Scope.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if not season:
-            season = get_current_season()
-        data = leagueleaders.LeagueLeaders(
-            season=season, season_type_all_star=season_type, per_mode_simple=per_mode,
-            stat_category_abbreviation=stat_category, scope=scope, league_id="00"
-        )
-        return f"# League Leaders - {stat_category} ({season})\n\n" + data.league_leaders.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool(meta={"category": ['league', 'player', 'statistics']})
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
+    data = _fetch(leagueleaders.LeagueLeaders,
+        season=season, season_type_all_star=season_type, per_mode_simple=per_mode,
+        stat_category_abbreviation=stat_category, scope=scope, league_id="00"
+    )
+    return f"# League Leaders - {stat_category} ({season})\n\n" + fast_md(data.league_leaders.get_data_frame())
+
+
+@nba_tool(meta={"category": ['league', 'player', 'statistics']})
 def get_league_dash_player_stats(
     season: Optional[str] = None,
     season_type: str = "Regular Season",
     per_mode: str = "PerGame",
-    measure_type: str = "Base"
+    measure_type: str = "Base",
+    limit: int = DEFAULT_ROW_LIMIT
 ) -> str:
     """
     Get league dashboard player stats with filters.
@@ -1408,25 +1468,21 @@ def get_league_dash_player_stats(
         season_type: Season type.
         per_mode: Per mode.
         measure_type: Measure type.
+        limit: Maximum number of players to return. Defaults to 200.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if not season:
-            season = get_current_season()
-        data = leaguedashplayerstats.LeagueDashPlayerStats(
-            season=season, season_type_all_star=season_type, per_mode_detailed=per_mode,
-            measure_type_detailed_defense=measure_type, league_id="00"
-        )
-        return f"# Player Stats - {season}\n\n" + data.league_dash_player_stats.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool(meta={"category": ['league', 'team', 'statistics']})
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
+    data = _fetch(leaguedashplayerstats.LeagueDashPlayerStats,
+        season=season, season_type_all_star=season_type, per_mode_detailed=per_mode,
+        measure_type_detailed_defense=measure_type, league_id="00"
+    )
+    df, note = _limit_rows(data.league_dash_player_stats.get_data_frame(), limit)
+    return f"# Player Stats - {season}\n\n" + fast_md(df) + note
+
+
+@nba_tool(meta={"category": ['league', 'team', 'statistics']})
 def get_league_dash_team_stats(
     team_name: str,
     season: Optional[str] = None,
@@ -1449,33 +1505,29 @@ def get_league_dash_team_stats(
         measure_type: Measure type.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        team_id = find_team_id(team_name)
-        if not team_id:
-            return f"Team '{team_name}' not found."
-        if not season:
-            season = get_current_season()
-        data = leaguedashteamstats.LeagueDashTeamStats(
-            season=season, season_type_all_star=season_type, per_mode_detailed=per_mode,
-            measure_type_detailed_defense=measure_type, league_id="00"
-        )
-        return f"# Team Stats - {season}\n\n" + data.league_dash_team_stats.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool(meta={"category": ['league', 'game']})
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    team_id = find_team_id(team_name)
+    if not team_id:
+        return f"Team '{team_name}' not found."
+    season = season or get_current_season()
+    data = _fetch(leaguedashteamstats.LeagueDashTeamStats,
+        season=season, season_type_all_star=season_type, per_mode_detailed=per_mode,
+        measure_type_detailed_defense=measure_type, league_id="00"
+    )
+    return f"# Team Stats - {season}\n\n" + fast_md(data.league_dash_team_stats.get_data_frame())
+
+
+@nba_tool(meta={"category": ['league', 'game']})
 def get_league_game_finder(
     season: Optional[str] = None,
     season_type: str = "Regular Season",
     player_or_team: str = "T",
     team_name: str = None,
     vs_team_name: str = None,
-    game_id_only: bool = False
+    game_id_only: bool = False,
+    columns: Optional[List[str]] = None,
+    limit: int = DEFAULT_ROW_LIMIT
 ) -> str:
     """
     Find games and game performance stats using specified filters. The stats can be broken down by player or team, but it is not possible to filter by player.
@@ -1488,43 +1540,47 @@ def get_league_game_finder(
         vs_team_name: Name of the opposing team to filter buy.
         player_or_team: P (for player) or T (for team). Useing P gives your player-specific stats breakdowns per game. T gives you team-level stats.
         game_id_only: True or False. If True, we'll only return the game_id column, which reduces the size of the returned payload. Defauts to False
+        columns: Only return these stat columns (e.g. ["GAME_DATE", "MATCHUP", "WL", "PTS", "REB", "AST"]), plus the team/player and game id columns, which are always included. Available: GAME_DATE, MATCHUP, WL, MIN, PTS, FGM, FGA, FG_PCT, FG3M, FG3A, FG3_PCT, FTM, FTA, FT_PCT, OREB, DREB, REB, AST, STL, BLK, TOV, PF, PLUS_MINUS. Defaults to all of them.
+        limit: Maximum number of rows to return. Defaults to 200.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        team_id = None
-        if team_name:
-            team_id = find_team_id(team_name)
-            if team_id is None:
-                return f"Team '{team_name}' not found. Check spelling."
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    team_id = None
+    if team_name:
+        team_id = find_team_id(team_name)
+        if team_id is None:
+            return f"Team '{team_name}' not found. Check spelling."
             
-        vs_team_id = None
-        if vs_team_name:
-            vs_team_id = find_team_id(vs_team_name)
-            if vs_team_id is None:
-                return f"Team '{vs_team_name}' not found. Check spelling."
+    vs_team_id = None
+    if vs_team_name:
+        vs_team_id = find_team_id(vs_team_name)
+        if vs_team_id is None:
+            return f"Team '{vs_team_name}' not found. Check spelling."
             
-        if not season:
-            season = get_current_season()
-        data = leaguegamefinder.LeagueGameFinder(
-            season_nullable=season, season_type_nullable=season_type,
-            team_id_nullable=team_id, vs_team_id_nullable=vs_team_id,
-            league_id_nullable="", player_or_team_abbreviation=player_or_team
-        )
-        if not game_id_only:
-            return f"# Game Finder Results\n\n" + data.league_game_finder_results.get_data_frame().to_markdown(index=False)
-        else:
-            df = data.league_game_finder_results.get_data_frame()
-            df = df[df.columns[:list(df.columns).index("GAME_ID")+1]] # drop all the stats columns after GAME_ID
-            return f"# Game Finder Results\n\n" + df.to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool(meta={"category": ['league']})
+    season = season or get_current_season()
+    data = _fetch(leaguegamefinder.LeagueGameFinder,
+        season_nullable=season, season_type_nullable=season_type,
+        team_id_nullable=team_id, vs_team_id_nullable=vs_team_id,
+        league_id_nullable="", player_or_team_abbreviation=player_or_team
+    )
+    if game_id_only:
+        # slice the id columns out of the raw rows, rather than building a frame of ~30 stat columns just to drop them
+        table = data.league_game_finder_results.get_dict()
+        end = table["headers"].index("GAME_ID") + 1
+        rows, note = _limit_rows(table["data"], limit)
+        return f"# Game Finder Results\n\n" + md_table(table["headers"][:end], [row[:end] for row in rows]) + note
+
+    df = data.league_game_finder_results.get_data_frame()
+    id_columns = df.columns[:df.columns.get_loc("GAME_ID")+1] # everything up to GAME_ID identifies the row, the rest are stats
+    if columns:
+        wanted = {c.upper().strip() for c in columns}
+        df = df[[c for c in df.columns if c in wanted or c in id_columns]]
+    df, note = _limit_rows(df, limit)
+    return f"# Game Finder Results\n\n" + fast_md(df) + note
+
+
+@nba_tool(meta={"category": ['league', 'live']})
 def get_league_standings(season: Optional[str] = None, season_type: str = "Regular Season") -> str:
     """
     Get league standings.
@@ -1534,20 +1590,14 @@ def get_league_standings(season: Optional[str] = None, season_type: str = "Regul
         season_type: Season type.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if not season:
-            season = get_current_season()
-        data = leaguestandings.LeagueStandings(season=season, season_type=season_type, league_id="00")
-        return f"# Standings - {season}\n\n" + data.standings.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
+    data = _fetch(leaguestandings.LeagueStandings, season=season, season_type=season_type, league_id="00")
+    return f"# Standings - {season}\n\n" + fast_md(data.standings.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['game']})
+@nba_tool(meta={"category": ['game', 'live']})
 def get_scoreboard(game_date: str) -> str:
     """
     Get scoreboard for a specific date (format: YYYY-MM-DD or MM/DD/YYYY).
@@ -1556,31 +1606,32 @@ def get_scoreboard(game_date: str) -> str:
         game_date: Game date.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        data = scoreboardv2.ScoreboardV2(game_date=game_date, league_id="00")
-        result = f"# Scoreboard - {game_date}\n\n"
-        result += "## Game Header\n" + data.game_header.get_data_frame().to_markdown(index=False) + "\n\n"
-        result += "## Line Score\n" + data.line_score.get_data_frame().to_markdown(index=False) + "\n\n"
-        return result
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool(meta={"category": ['game']})
-def get_play_by_play(game_id: str, start_period: int = 0, end_period: int = 10) -> str:
-    """Get play-by-play data for a game."""
-    try:
-        data = playbyplayv2.PlayByPlayV2(game_id=game_id, start_period=start_period, end_period=end_period)
-        return f"# Play by Play - {game_id}\n\n" + data.play_by_play.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    data = _fetch(scoreboardv2.ScoreboardV2, game_date=game_date, league_id="00")
+    parts = [f"# Scoreboard - {game_date}\n\n"]
+    parts += ["## Game Header\n", _dataset_md(data.game_header), "\n\n"]
+    parts += ["## Line Score\n", _dataset_md(data.line_score), "\n\n"]
+    return "".join(parts)
+
+
+@nba_tool(meta={"category": ['game', 'live']})
+def get_play_by_play(game_id: str, start_period: int = 0, end_period: int = 10, limit: int = DEFAULT_ROW_LIMIT) -> str:
+    """Get play-by-play data for a game. Returns at most `limit` events (default 200); narrow start_period/end_period to see later in the game."""
+    data = _fetch(playbyplayv2.PlayByPlayV2, game_id=game_id, start_period=start_period, end_period=end_period)
+    df, note = _limit_rows(data.play_by_play.get_data_frame(), limit)
+    return f"# Play by Play - {game_id}\n\n" + fast_md(df) + note
 
 
-@mcp.tool(meta={"category": ['player', 'statistics']})
+# season type -> PlayerCareerStats dataset. The response carries all of them; only the requested one is turned into a frame.
+_CAREER_STATS_DATASETS = MappingProxyType({
+    "Regular Season": "season_totals_regular_season",
+    "All Star": "season_totals_all_star_season",
+    "Post Season": "season_totals_post_season",
+    "College Season": "season_totals_college_season"
+})
+
+@nba_tool(meta={"category": ['player', 'statistics']}, fallback_args=("season_type",))
 def get_player_regular_season_stats(player_name: str, season_type: str = "Regular") -> str:
     """
     Get a player's complete regular season statistics broken down by season.
@@ -1595,78 +1646,57 @@ def get_player_regular_season_stats(player_name: str, season_type: str = "Regula
         season_type [default: Regular Season]: Any of: "Regular Season", "All Star", "Post Season", "College Season"
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    - per_mode36: Options appear to be Per36, PerGame, and Totals. Totals is derivable so I just defaulted to PerGame
-    Other Notes:
-    - This also returns season rankings, but only for the regular and post seasons, so I think these could be exposed via a separate funciton. 
-    """
-    try:
-        player_id = find_player_id(player_name)
-        if not player_id:
-            return f"Player '{player_name}' not found."
-        career_stats = playercareerstats.PlayerCareerStats(player_id=player_id, per_mode36="PerGame")
-        # only return stats for the desired season type:
-        if season_type == "All Star":
-            career_stats = career_stats.season_totals_all_star_season
-        if season_type == "Post Season":
-            career_stats = career_stats.season_totals_post_season
-        elif season_type == "College Season":
-            career_stats = career_stats.season_totals_college_season
-        else: # default to regular sseason
-            season_type = "Regular Season" # just in case something illegal was provided
-            career_stats = career_stats.season_totals_regular_season
-
-        return f"{player_name} Career Stats for {season_type}\n\n" + career_stats.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool(meta={"category": ['player']})
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    # - per_mode36: Options appear to be Per36, PerGame, and Totals. Totals is derivable so I just defaulted to PerGame
+    # Other Notes:
+    # - This also returns season rankings, but only for the regular and post seasons, so I think these could be exposed via a separate funciton. 
+    player_id = find_player_id(player_name)
+    if not player_id:
+        return f"Player '{player_name}' not found."
+    # only return stats for the desired season type, default to regular season (just in case something illegal was provided)
+    if season_type not in _CAREER_STATS_DATASETS:
+        season_type = "Regular Season"
+    career_stats = _fetch(playercareerstats.PlayerCareerStats, player_id=player_id, per_mode36="PerGame")
+    dataset = getattr(career_stats, _CAREER_STATS_DATASETS[season_type])
+
+    return f"{player_name} Career Stats for {season_type}\n\n" + fast_md(dataset.get_data_frame())
+
+
+@nba_tool(meta={"category": ['player']})
 def get_player_awards(player_name: str) -> str:
     """Get player awards and honors. Accepts player name."""
-    try:
-        player_id = find_player_id(player_name)
-        if not player_id:
-            return f"Player '{player_name}' not found."
-        data = playerawards.PlayerAwards(player_id=player_id)
-        return f"# Awards - {player_name}\n\n" + data.player_awards.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    player_id = find_player_id(player_name)
+    if not player_id:
+        return f"Player '{player_name}' not found."
+    data = _fetch(playerawards.PlayerAwards, player_id=player_id)
+    return f"# Awards - {player_name}\n\n" + fast_md(data.player_awards.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['player', 'game']})
+@nba_tool(meta={"category": ['player', 'game']})
 def get_player_game_log(player_name: str, season: Optional[str] = None, season_type: str = "Regular Season") -> str:
     """Get player game log for a season. Accepts player name."""
-    try:
-        player_id = find_player_id(player_name)
-        if not player_id:
-            return f"Player '{player_name}' not found."
-        if not season:
-            season = get_current_season()
-        data = playergamelog.PlayerGameLog(player_id=player_id, season=season, season_type_all_star=season_type)
-        return f"# Game Log - {player_name} ({season})\n\n" + data.player_game_log.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    player_id = find_player_id(player_name)
+    if not player_id:
+        return f"Player '{player_name}' not found."
+    season = season or get_current_season()
+    data = _fetch(playergamelog.PlayerGameLog, player_id=player_id, season=season, season_type_all_star=season_type)
+    return f"# Game Log - {player_name} ({season})\n\n" + fast_md(data.player_game_log.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['player']})
+@nba_tool(meta={"category": ['player']})
 def get_player_profile(player_name: str, per_mode: str = "PerGame") -> str:
     """Get complete player profile. Accepts player name."""
-    try:
-        player_id = find_player_id(player_name)
-        if not player_id:
-            return f"Player '{player_name}' not found."
-        data = playerprofilev2.PlayerProfileV2(player_id=player_id, per_mode_simple=per_mode)
-        result = f"# Player Profile - {player_name}\n\n"
-        result += "## Season Totals\n" + data.season_totals_regular_season.get_data_frame().to_markdown(index=False) + "\n\n"
-        return result
-    except Exception as e:
-        return f"Error: {str(e)}"
+    player_id = find_player_id(player_name)
+    if not player_id:
+        return f"Player '{player_name}' not found."
+    data = _fetch(playerprofilev2.PlayerProfileV2, player_id=player_id, per_mode_simple=per_mode)
+    parts = [f"# Player Profile - {player_name}\n\n"]
+    parts += ["## Season Totals\n", _dataset_md(data.season_totals_regular_season), "\n\n"]
+    return "".join(parts)
 
 
-@mcp.tool(meta={"category": ['player']})
+@nba_tool(meta={"category": ['player']})
 def get_player_vs_player(
     player_name1: str,
     player_name2: str,
@@ -1675,25 +1705,23 @@ def get_player_vs_player(
     per_mode: str = "PerGame"
 ) -> str:
     """Compare two players head-to-head. Accepts player names."""
-    try:
-        player_id1 = find_player_id(player_name1)
-        player_id2 = find_player_id(player_name2)
-        if not player_id1:
-            return f"Player '{player_name1}' not found."
-        if not player_id2:
-            return f"Player '{player_name2}' not found."
-        if not season:
-            season = get_current_season()
-        data = playervsplayer.PlayerVsPlayer(
-            player_id=player_id1, vs_player_id=player_id2, season=season,
-            season_type_all_star=season_type, per_mode_simple=per_mode
-        )
-        return f"# {player_name1} vs {player_name2} - {season}\n\n" + data.overall.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool(meta={"category": ['playoff']})
+    player_id1 = find_player_id(player_name1)
+    player_id2 = find_player_id(player_name2)
+    if not player_id1:
+        return f"Player '{player_name1}' not found."
+    if not player_id2:
+        return f"Player '{player_name2}' not found."
+    season = season or get_current_season()
+    data = _fetch(playervsplayer.PlayerVsPlayer,
+        player_id=player_id1, vs_player_id=player_id2, season=season,
+        season_type_all_star=season_type, per_mode_simple=per_mode
+    )
+    return f"# {player_name1} vs {player_name2} - {season}\n\n" + fast_md(data.overall.get_data_frame())
+
+
+_SEASON_ID_PREFIX = {"Pre Season": "1", "Regular Season": "2", "All Star": "3", "Playoffs": "4", "PlayIn": "5"}
+
+@nba_tool(meta={"category": ['playoff', 'live']})
 def get_playoff_picture(season: Optional[str] = None, season_type: str = "Regular Season") -> str:
     """
     Get current playoff picture/standings.
@@ -1703,38 +1731,37 @@ def get_playoff_picture(season: Optional[str] = None, season_type: str = "Regula
         season_type: Season type.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if not season:
-            season = get_current_season()
-        data = playoffpicture.PlayoffPicture(season_id=season, league_id="00")
-        return f"# Playoff Picture - {season}\n\n" + data.playoff_picture.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool(meta={"category": ['player', 'shooting']})
-def get_shot_chart(player_name: str, season: Optional[str] = None, season_type: str = "Regular Season") -> str:
-    """Get shot chart data for a player. Accepts player name."""
-    try:
-        player_id = find_player_id(player_name)
-        if not player_id:
-            return f"Player '{player_name}' not found."
-        if not season:
-            season = get_current_season()
-        data = shotchartdetail.ShotChartDetail(
-            player_id=player_id, team_id=0, season_nullable=season,
-            season_type_all_star=season_type, context_measure_simple="FGA"
-        )
-        return f"# Shot Chart - {player_name} ({season})\n\n" + data.shot_chart_detail.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool(meta={"category": ['team']})
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
+    # PlayoffPicture takes a SeasonID, the season's start year behind a season type digit ("2025-26" regular season -> "22025")
+    season_id = _SEASON_ID_PREFIX.get(season_type, "2") + season[:4]
+    data = _fetch(playoffpicture.PlayoffPicture, season_id=season_id, league_id="00")
+
+    parts = [f"# Playoff Picture - {season}\n\n"]
+    for conference, prefix in (("Eastern", "east_conf"), ("Western", "west_conf")):
+        parts += [f"## {conference} Conference Standings\n", _dataset_md(getattr(data, f"{prefix}_standings")), "\n\n"]
+        parts += [f"## {conference} Conference Playoff Picture\n", _dataset_md(getattr(data, f"{prefix}_playoff_picture")), "\n\n"]
+        parts += [f"## {conference} Conference Remaining Games\n", _dataset_md(getattr(data, f"{prefix}_remaining_games")), "\n\n"]
+    return "".join(parts)
+
+
+@nba_tool(meta={"category": ['player', 'shooting']})
+def get_shot_chart(player_name: str, season: Optional[str] = None, season_type: str = "Regular Season", limit: int = DEFAULT_ROW_LIMIT) -> str:
+    """Get shot chart data for a player. Accepts player name. Returns at most `limit` rows (default 200)."""
+    player_id = find_player_id(player_name)
+    if not player_id:
+        return f"Player '{player_name}' not found."
+    season = season or get_current_season()
+    data = _fetch(shotchartdetail.ShotChartDetail,
+        player_id=player_id, team_id=0, season_nullable=season,
+        season_type_all_star=season_type, context_measure_simple="FGA"
+    )
+    df, note = _limit_rows(data.shot_chart_detail.get_data_frame(), limit)
+    return f"# Shot Chart - {player_name} ({season})\n\n" + fast_md(df) + note
+
+
+@nba_tool(meta={"category": ['team']})
 def get_team_details(team_name: str) -> str:
     """Get team trivia details and history. Data includes:
         TEAM_ID, ABBREVIATION, NICKNAME, YEARFOUNDED, CITY, ARENA,
@@ -1745,19 +1772,16 @@ def get_team_details(team_name: str) -> str:
         team_name: Team name.
     
     """
-    try:
-        team_id = find_team_id(team_name)
-        if not team_id:
-            return f"Team '{team_name}' not found."
-        data = teamdetails.TeamDetails(team_id=team_id)
-        result = f"# Team Details - {team_name}\n\n"
-        result += "## Team Background\n" + data.team_background.get_data_frame().to_markdown(index=False) + "\n\n"
-        result += "## Team History\n" + data.team_history.get_data_frame().to_markdown(index=False) + "\n\n"
-        return result
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-@mcp.tool(meta={"category": ['team']})
+    team_id = find_team_id(team_name)
+    if not team_id:
+        return f"Team '{team_name}' not found."
+    data = _fetch(teamdetails.TeamDetails, team_id=team_id)
+    parts = [f"# Team Details - {team_name}\n\n"]
+    parts += ["## Team Background\n", _dataset_md(data.team_background), "\n\n"]
+    parts += ["## Team History\n", _dataset_md(data.team_history), "\n\n"]
+    return "".join(parts)
+
+@nba_tool(meta={"category": ['team']})
 def get_team_info(team_name: str, season: Optional[str] = None) -> str:
     """
     Get team information. Accepts team name.
@@ -1767,26 +1791,20 @@ def get_team_info(team_name: str, season: Optional[str] = None) -> str:
         season: Season.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        team_id = find_team_id(team_name)
-        if not team_id:
-            return f"Team '{team_name}' not found."
-        if not season:
-            season = get_current_season()
-        data = teaminfocommon.TeamInfoCommon(team_id=team_id, season_nullable=season, league_id="00")
-        result = f"# Team Info - {team_name}\n\n"
-        result += "## Team Info\n" + data.team_info_common.get_data_frame().to_markdown(index=False) + "\n\n"
-        result += "## Season Ranks\n" + data.team_season_ranks.get_data_frame().to_markdown(index=False) + "\n\n"
-        return result
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool(meta={"category": ['team', 'player']})
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    team_id = find_team_id(team_name)
+    if not team_id:
+        return f"Team '{team_name}' not found."
+    season = season or get_current_season()
+    data = _fetch(teaminfocommon.TeamInfoCommon, team_id=team_id, season_nullable=season, league_id="00")
+    parts = [f"# Team Info - {team_name}\n\n"]
+    parts += ["## Team Info\n", _dataset_md(data.team_info_common), "\n\n"]
+    parts += ["## Season Ranks\n", _dataset_md(data.team_season_ranks), "\n\n"]
+    return "".join(parts)
+
+
+@nba_tool(meta={"category": ['team', 'player']})
 def get_team_vs_player(
     team_name: str,
     player_name: str,
@@ -1795,125 +1813,98 @@ def get_team_vs_player(
     per_mode: str = "PerGame"
 ) -> str:
     """Get team vs player matchup stats. Accepts team and player names."""
-    try:
-        team_id = find_team_id(team_name)
-        player_id = find_player_id(player_name)
-        if not team_id:
-            return f"Team '{team_name}' not found."
-        if not player_id:
-            return f"Player '{player_name}' not found."
-        if not season:
-            season = get_current_season()
-        data = teamvsplayer.TeamVsPlayer(
-            team_id=team_id, vs_player_id=player_id, season=season,
-            season_type_all_star=season_type, per_mode_simple=per_mode
-        )
-        return f"# {team_name} vs {player_name} - {season}\n\n" + data.overall.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool(meta={"category": ['game']})
+    team_id = find_team_id(team_name)
+    player_id = find_player_id(player_name)
+    if not team_id:
+        return f"Team '{team_name}' not found."
+    if not player_id:
+        return f"Player '{player_name}' not found."
+    season = season or get_current_season()
+    data = _fetch(teamvsplayer.TeamVsPlayer,
+        team_id=team_id, vs_player_id=player_id, season=season,
+        season_type_all_star=season_type, per_mode_simple=per_mode
+    )
+    return f"# {team_name} vs {player_name} - {season}\n\n" + fast_md(data.overall.get_data_frame())
+
+
+@nba_tool(meta={"category": ['game', 'live']})
 def get_win_probability(game_id: str) -> str:
     """Get win probability play-by-play for a game."""
-    try:
-        data = winprobabilitypbp.WinProbabilityPBP(game_id=game_id)
-        return f"# Win Probability - {game_id}\n\n" + data.win_prob_pbp.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    data = _fetch(winprobabilitypbp.WinProbabilityPBP, game_id=game_id)
+    return f"# Win Probability - {game_id}\n\n" + fast_md(data.win_prob_pbp.get_data_frame())
 
 
 # Additional comprehensive endpoints with common parameter patterns
-@mcp.tool(meta={"category": ['league', 'statistics']})
-def get_league_dash_lineups(season: Optional[str] = None, season_type: str = "Regular Season", measure_type: str = "Base") -> str:
-    """Get league lineup statistics."""
-    try:
-        if not season:
-            season = get_current_season()
-        data = leaguedashlineups.LeagueDashLineups(season=season, season_type_all_star=season_type, measure_type_detailed_defense=measure_type)
-        return f"# Lineup Stats - {season}\n\n" + data.league_dash_lineups.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+@nba_tool(meta={"category": ['league', 'statistics']})
+def get_league_dash_lineups(season: Optional[str] = None, season_type: str = "Regular Season", measure_type: str = "Base", limit: int = DEFAULT_ROW_LIMIT) -> str:
+    """Get league lineup statistics. Returns at most `limit` rows (default 200)."""
+    season = season or get_current_season()
+    data = _fetch(leaguedashlineups.LeagueDashLineups, season=season, season_type_all_star=season_type, measure_type_detailed_defense=measure_type)
+    df, note = _limit_rows(data.lineups.get_data_frame(), limit)
+    return f"# Lineup Stats - {season}\n\n" + fast_md(df) + note
 
 
-@mcp.tool(meta={"category": ['player', 'statistics']})
+@nba_tool(meta={"category": ['player', 'statistics']})
 def get_player_clutch_stats(player_name: str, season: Optional[str] = None, per_mode: str = "PerGame") -> str:
     """Get player clutch performance stats. Accepts player name."""
-    try:
-        player_id = find_player_id(player_name)
-        if not player_id:
-            return f"Player '{player_name}' not found."
-        if not season:
-            season = get_current_season()
-        data = playerdashboardbyclutch.PlayerDashboardByClutch(player_id=player_id, season=season, per_mode_detailed=per_mode)
-        return f"# Clutch Stats - {player_name} ({season})\n\n" + data.overall_player_dashboard.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    player_id = find_player_id(player_name)
+    if not player_id:
+        return f"Player '{player_name}' not found."
+    season = season or get_current_season()
+    data = _fetch(playerdashboardbyclutch.PlayerDashboardByClutch, player_id=player_id, season=season, per_mode_detailed=per_mode)
+    return f"# Clutch Stats - {player_name} ({season})\n\n" + fast_md(data.overall_player_dashboard.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['player', 'statistics']})
+@nba_tool(meta={"category": ['player', 'statistics']})
 def get_player_shooting_splits(player_name: str, season: Optional[str] = None, per_mode: str = "PerGame") -> str:
     """Get player shooting splits by zone/distance. Accepts player name."""
-    try:
-        player_id = find_player_id(player_name)
-        if not player_id:
-            return f"Player '{player_name}' not found."
-        if not season:
-            season = get_current_season()
-        data = playerdashboardbyshootingsplits.PlayerDashboardByShootingSplits(player_id=player_id, season=season, per_mode_detailed=per_mode)
-        return f"# Shooting Splits - {player_name} ({season})\n\n" + data.overall_player_dashboard.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool(meta={"category": ['team', 'statistics']})
-def get_team_clutch_stats(team_name: str, season: Optional[str] = None, per_mode: str = "PerGame") -> str:
-    """Get team clutch performance stats. Accepts team name."""
-    try:
-        team_id = find_team_id(team_name)
-        if not team_id:
-            return f"Team '{team_name}' not found."
-        if not season:
-            season = get_current_season()
-        data = leaguedashteamclutch.LeagueDashTeamClutch(season=season, season_type_all_star="Regular Season", per_mode_detailed=per_mode)
-        df = data.league_dash_team_clutch.get_data_frame()
-        team_data = df[df['TEAM_ID'] == team_id] if 'TEAM_ID' in df.columns else df
-        return f"# Clutch Stats - {team_name} ({season})\n\n" + team_data.to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    player_id = find_player_id(player_name)
+    if not player_id:
+        return f"Player '{player_name}' not found."
+    season = season or get_current_season()
+    data = _fetch(playerdashboardbyshootingsplits.PlayerDashboardByShootingSplits, player_id=player_id, season=season, per_mode_detailed=per_mode)
+    return f"# Shooting Splits - {player_name} ({season})\n\n" + fast_md(data.overall_player_dashboard.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['team', 'statistics']})
+@nba_tool(meta={"category": ['team', 'statistics']})
+def get_team_clutch_stats(
+    team_name: str, season: Optional[str] = None, per_mode: str = "PerGame", season_type: str = "Regular Season"
+) -> str:
+    """Get team clutch performance stats. Accepts team name. season_type: "Regular Season", "Playoffs" or "Pre Season"."""
+    team_id = find_team_id(team_name)
+    if not team_id:
+        return f"Team '{team_name}' not found."
+    season = season or get_current_season()
+    # filtered to the team by stats.nba.com rather than pulling the whole league and masking it here
+    data = _fetch(leaguedashteamclutch.LeagueDashTeamClutch,
+        season=season, season_type_all_star=season_type, per_mode_detailed=per_mode, team_id_nullable=team_id
+    )
+    return f"# Clutch Stats - {team_name} ({season})\n\n" + fast_md(data.league_dash_team_clutch.get_data_frame())
+
+
+@nba_tool(meta={"category": ['team', 'statistics']})
 def get_team_shooting_splits(team_name: str, season: Optional[str] = None, per_mode: str = "PerGame") -> str:
     """Get team shooting splits. Accepts team name."""
-    try:
-        team_id = find_team_id(team_name)
-        if not team_id:
-            return f"Team '{team_name}' not found."
-        if not season:
-            season = get_current_season()
-        data = teamdashboardbyshootingsplits.TeamDashboardByShootingSplits(team_id=team_id, season=season, per_mode_detailed=per_mode)
-        return f"# Shooting Splits - {team_name} ({season})\n\n" + data.overall_team_dashboard.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    team_id = find_team_id(team_name)
+    if not team_id:
+        return f"Team '{team_name}' not found."
+    season = season or get_current_season()
+    data = _fetch(teamdashboardbyshootingsplits.TeamDashboardByShootingSplits, team_id=team_id, season=season, per_mode_detailed=per_mode)
+    return f"# Shooting Splits - {team_name} ({season})\n\n" + fast_md(data.overall_team_dashboard.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['team', 'statistics']})
+@nba_tool(meta={"category": ['team', 'statistics']})
 def get_team_lineups(team_name: str, season: Optional[str] = None, measure_type: str = "Base") -> str:
     """Get team lineup statistics. Accepts team name."""
-    try:
-        team_id = find_team_id(team_name)
-        if not team_id:
-            return f"Team '{team_name}' not found."
-        if not season:
-            season = get_current_season()
-        data = teamdashlineups.TeamDashLineups(team_id=team_id, season=season, measure_type_detailed_defense=measure_type)
-        return f"# Lineups - {team_name} ({season})\n\n" + data.lineups.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    team_id = find_team_id(team_name)
+    if not team_id:
+        return f"Team '{team_name}' not found."
+    season = season or get_current_season()
+    data = _fetch(teamdashlineups.TeamDashLineups, team_id=team_id, season=season, measure_type_detailed_defense=measure_type)
+    return f"# Lineups - {team_name} ({season})\n\n" + fast_md(data.lineups.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['team', 'historical']})
+@nba_tool(meta={"category": ['team', 'historical']})
 def get_team_historical_leaders(team_name: str) -> str:
     """
     Get team all-time statistical leaders. Accepts team name.
@@ -1922,21 +1913,16 @@ def get_team_historical_leaders(team_name: str) -> str:
         team_name: Team name.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        team_id = find_team_id(team_name)
-        if not team_id:
-            return f"Team '{team_name}' not found."
-        data = teamhistoricalleaders.TeamHistoricalLeaders(team_id=team_id, league_id="00")
-        return f"# Historical Leaders - {team_name}\n\n" + data.team_historical_leaders.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    team_id = find_team_id(team_name)
+    if not team_id:
+        return f"Team '{team_name}' not found."
+    data = _fetch(teamhistoricalleaders.TeamHistoricalLeaders, team_id=team_id, league_id="00")
+    return f"# Historical Leaders - {team_name}\n\n" + fast_md(data.team_historical_leaders.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['team', 'statistics', 'historical']})
+@nba_tool(meta={"category": ['team', 'statistics', 'historical']})
 def get_team_year_by_year(team_name: str, per_mode: str = "PerGame") -> str:
     """
     Get team year-by-year stats. Accepts team name.
@@ -1946,21 +1932,16 @@ def get_team_year_by_year(team_name: str, per_mode: str = "PerGame") -> str:
         per_mode: Per mode.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        team_id = find_team_id(team_name)
-        if not team_id:
-            return f"Team '{team_name}' not found."
-        data = teamyearbyyearstats.TeamYearByYearStats(team_id=team_id, league_id="00", per_mode_simple=per_mode)
-        return f"# Year by Year - {team_name}\n\n" + data.team_stats.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    team_id = find_team_id(team_name)
+    if not team_id:
+        return f"Team '{team_name}' not found."
+    data = _fetch(teamyearbyyearstats.TeamYearByYearStats, team_id=team_id, league_id="00", per_mode_simple=per_mode)
+    return f"# Year by Year - {team_name}\n\n" + fast_md(data.team_stats.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['player']})
+@nba_tool(meta={"category": ['player']})
 def get_player_compare(
     player_names: str,
     season: Optional[str] = None,
@@ -1968,108 +1949,78 @@ def get_player_compare(
     per_mode: str = "PerGame"
 ) -> str:
     """Compare multiple players (comma-separated names)."""
-    try:
-        names = [n.strip() for n in player_names.split(',')]
-        player_ids = []
-        for name in names:
-            pid = find_player_id(name)
-            if pid:
-                player_ids.append(str(pid))
-        if not player_ids:
-            return "No players found."
-        if not season:
-            season = get_current_season()
-        data = playercompare.PlayerCompare(
-            player_id_list=','.join(player_ids), vs_player_id_list='0',
-            season=season, season_type_all_star=season_type, per_mode_simple=per_mode
-        )
-        return f"# Player Comparison - {season}\n\n" + data.overall_compare.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool(meta={"category": ['season']})
-def get_schedule(season: Optional[str] = None) -> str:
+    player_ids = [str(pid) for pid in map(find_player_id, player_names.split(',')) if pid] # find_player_id strips the names
+    if not player_ids:
+        return "No players found."
+    season = season or get_current_season()
+    data = _fetch(playercompare.PlayerCompare,
+        player_id_list=','.join(player_ids), vs_player_id_list='0',
+        season=season, season_type_all_star=season_type, per_mode_simple=per_mode
+    )
+    return f"# Player Comparison - {season}\n\n" + fast_md(data.overall_compare.get_data_frame())
+
+
+@nba_tool(meta={"category": ['season']})
+def get_schedule(season: Optional[str] = None, limit: int = DEFAULT_ROW_LIMIT) -> str:
     """
     Get league schedule.
     
     Args:
         season: Season.
+        limit: Maximum number of rows to return. Defaults to 200.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if not season:
-            season = get_current_season()
-        data = scheduleleaguev2.ScheduleLeagueV2(season=season, league_id="00")
-        return f"# Schedule - {season}\n\n" + data.schedule.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
+    data = _fetch(scheduleleaguev2.ScheduleLeagueV2, season=season, league_id="00")
+    df, note = _limit_rows(data.season_games.get_data_frame(), limit)
+    return f"# Schedule - {season}\n\n" + fast_md(df) + note
 
 
 # Additional specialized endpoints
-@mcp.tool(meta={"category": ['boxscore', 'game', 'tracking']})
+@nba_tool(meta={"category": ['boxscore', 'game', 'tracking', 'live']})
 def get_hustle_stats_boxscore(game_id: str) -> str:
     """Get hustle stats for a specific game (alternate endpoint)."""
-    try:
-        data = hustlestatsboxscore.HustleStatsBoxscore(game_id=game_id)
-        return f"# Hustle Stats - {game_id}\n\n" + data.hustle_stats_boxscore.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    data = _fetch(hustlestatsboxscore.HustleStatsBoxscore, game_id=game_id)
+    return f"# Hustle Stats - {game_id}\n\n" + fast_md(data.hustle_stats_boxscore.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['league', 'player', 'tracking']})
-def get_league_hustle_stats_player(season: Optional[str] = None, per_mode: str = "PerGame") -> str:
-    """Get league-wide player hustle statistics."""
-    try:
-        if not season:
-            season = get_current_season()
-        data = leaguehustlestatsplayer.LeagueHustleStatsPlayer(season=season, per_mode_time=per_mode)
-        return f"# Player Hustle Stats - {season}\n\n" + data.hustle_stats_player.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+@nba_tool(meta={"category": ['league', 'player', 'tracking']})
+def get_league_hustle_stats_player(season: Optional[str] = None, per_mode: str = "PerGame", limit: int = DEFAULT_ROW_LIMIT) -> str:
+    """Get league-wide player hustle statistics. Returns at most `limit` rows (default 200)."""
+    season = season or get_current_season()
+    data = _fetch(leaguehustlestatsplayer.LeagueHustleStatsPlayer, season=season, per_mode_time=per_mode)
+    df, note = _limit_rows(data.hustle_stats_player.get_data_frame(), limit)
+    return f"# Player Hustle Stats - {season}\n\n" + fast_md(df) + note
 
 
-@mcp.tool(meta={"category": ['league', 'team', 'tracking']})
+@nba_tool(meta={"category": ['league', 'team', 'tracking']})
 def get_league_hustle_stats_team(season: Optional[str] = None, per_mode: str = "PerGame") -> str:
     """Get league-wide team hustle statistics."""
-    try:
-        if not season:
-            season = get_current_season()
-        data = leaguehustlestatsteam.LeagueHustleStatsTeam(season=season, per_mode_time=per_mode)
-        return f"# Team Hustle Stats - {season}\n\n" + data.hustle_stats_team.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    season = season or get_current_season()
+    data = _fetch(leaguehustlestatsteam.LeagueHustleStatsTeam, season=season, per_mode_time=per_mode)
+    return f"# Team Hustle Stats - {season}\n\n" + fast_md(data.hustle_stats_team.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['player', 'advanced']})
-def get_player_estimated_metrics(season: Optional[str] = None) -> str:
-    """Get player estimated advanced metrics."""
-    try:
-        if not season:
-            season = get_current_season()
-        data = playerestimatedmetrics.PlayerEstimatedMetrics(season=season)
-        return f"# Player Estimated Metrics - {season}\n\n" + data.player_estimated_metrics.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+@nba_tool(meta={"category": ['player', 'advanced']})
+def get_player_estimated_metrics(season: Optional[str] = None, limit: int = DEFAULT_ROW_LIMIT) -> str:
+    """Get player estimated advanced metrics. Returns at most `limit` rows (default 200)."""
+    season = season or get_current_season()
+    data = _fetch(playerestimatedmetrics.PlayerEstimatedMetrics, season=season)
+    df, note = _limit_rows(data.player_estimated_metrics.get_data_frame(), limit)
+    return f"# Player Estimated Metrics - {season}\n\n" + fast_md(df) + note
 
 
-@mcp.tool(meta={"category": ['team', 'advanced']})
+@nba_tool(meta={"category": ['team', 'advanced']})
 def get_team_estimated_metrics(season: Optional[str] = None) -> str:
     """Get team estimated advanced metrics."""
-    try:
-        if not season:
-            season = get_current_season()
-        data = teamestimatedmetrics.TeamEstimatedMetrics(season=season)
-        return f"# Team Estimated Metrics - {season}\n\n" + data.team_estimated_metrics.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    season = season or get_current_season()
+    data = _fetch(teamestimatedmetrics.TeamEstimatedMetrics, season=season)
+    return f"# Team Estimated Metrics - {season}\n\n" + fast_md(data.team_estimated_metrics.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['advanced', 'statistics']})
+@nba_tool(meta={"category": ['advanced', 'statistics']})
 def get_synergy_play_types(
     player_name: Optional[str] = None,
     team_name: Optional[str] = None,
@@ -2077,71 +2028,60 @@ def get_synergy_play_types(
     season_type: str = "Regular Season"
 ) -> str:
     """Get Synergy play type statistics. Provide either player or team name."""
-    try:
-        if not season:
-            season = get_current_season()
-        
-        player_id = 0
-        team_id = 0
-        entity_name = ""
-        
-        if player_name:
-            player_id = find_player_id(player_name)
-            if not player_id:
-                return f"Player '{player_name}' not found."
-            entity_name = player_name
-        elif team_name:
-            team_id = find_team_id(team_name)
-            if not team_id:
-                return f"Team '{team_name}' not found."
-            entity_name = team_name
-        else:
-            return "Please provide either player_name or team_name."
-        
-        data = synergyplaytypes.SynergyPlayTypes(
-            player_or_team="P" if player_name else "T",
-            season=season, season_type=season_type,
-            per_mode="PerGame", type_grouping="offensive"
-        )
-        return f"# Synergy Play Types - {entity_name} ({season})\n\n" + data.synergy_play_types.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool(meta={"category": ['league', 'statistics']})
-def get_matchups_rollup(season: Optional[str] = None, per_mode: str = "PerGame") -> str:
+    season = season or get_current_season()
+        
+    player_id = 0
+    team_id = 0
+    entity_name = ""
+        
+    if player_name:
+        player_id = find_player_id(player_name)
+        if not player_id:
+            return f"Player '{player_name}' not found."
+        entity_name = player_name
+    elif team_name:
+        team_id = find_team_id(team_name)
+        if not team_id:
+            return f"Team '{team_name}' not found."
+        entity_name = team_name
+    else:
+        return "Please provide either player_name or team_name."
+        
+    data = _fetch(synergyplaytypes.SynergyPlayTypes,
+        player_or_team="P" if player_name else "T",
+        season=season, season_type=season_type,
+        per_mode="PerGame", type_grouping="offensive"
+    )
+    return f"# Synergy Play Types - {entity_name} ({season})\n\n" + fast_md(data.synergy_play_types.get_data_frame())
+
+
+@nba_tool(meta={"category": ['league', 'statistics']})
+def get_matchups_rollup(season: Optional[str] = None, per_mode: str = "PerGame", limit: int = DEFAULT_ROW_LIMIT) -> str:
     """
     Get matchup statistics rollup.
     
     Args:
         season: Season.
         per_mode: Per mode.
+        limit: Maximum number of rows to return. Defaults to 200.
     
     """
-    """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
-    """
-    try:
-        if not season:
-            season = get_current_season()
-        data = matchupsrollup.MatchupsRollup(league_id="00", season=season, per_mode_simple=per_mode)
-        return f"# Matchups Rollup - {season}\n\n" + data.matchups.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    season = season or get_current_season()
+    data = _fetch(matchupsrollup.MatchupsRollup, league_id="00", season=season, per_mode_simple=per_mode)
+    df, note = _limit_rows(data.matchups_rollup.get_data_frame(), limit)
+    return f"# Matchups Rollup - {season}\n\n" + fast_md(df) + note
 
 
-@mcp.tool(meta={"category": ['game', 'video']})
+@nba_tool(meta={"category": ['game', 'video', 'live']})
 def get_video_events(game_id: str, game_event_id: Optional[int] = None) -> str:
     """Get video events for a game."""
-    try:
-        data = videoevents.VideoEvents(game_id=game_id, game_event_id=game_event_id or 0)
-        return f"# Video Events - {game_id}\n\n" + data.video_events.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+    data = _fetch(videoevents.VideoEvents, game_id=game_id, game_event_id=game_event_id or 0)
+    return f"# Video Events - {game_id}\n\n" + fast_md(data.video_events.get_data_frame())
 
 
-@mcp.tool(meta={"category": ['game', 'video']})
+@nba_tool(meta={"category": ['game', 'video', 'live']})
 def get_video_status(game_date: str) -> str:
     """
     Get video availability status for games on a date.
@@ -2150,17 +2090,36 @@ def get_video_status(game_date: str) -> str:
         game_date: Game date.
     
     """
+    # Hidden parameters (fixed by the tool):
+    # - league_id: League ID ("00" for NBA).
+    data = _fetch(videostatus.VideoStatus, game_date=game_date, league_id="00")
+    return f"# Video Status - {game_date}\n\n" + fast_md(data.video_status.get_data_frame())
+
+def _warm_calls():
     """
-    Hidden Parameters:
-    - league_id: League ID ("00" for NBA).
+    The tool calls most often made first: standings, league leaders, today's games, this season's schedule and playoff
+    picture, each with the arguments the model usually passes (the defaults).
     """
+    return [
+        (get_league_standings, {}),
+        (get_league_leaders, {}),
+        (get_scoreboard, {"game_date": time.strftime("%Y-%m-%d")}),
+        (get_schedule, {}),
+        (get_playoff_picture, {})
+    ]
+
+def _warm_cache(tool, kwargs):
+    """Run a tool's undecorated body once, which leaves its responses in the endpoint and HTTP caches."""
     try:
-        data = videostatus.VideoStatus(game_date=game_date, league_id="00")
-        return f"# Video Status - {game_date}\n\n" + data.video_status.get_data_frame().to_markdown(index=False)
-    except Exception as e:
-        return f"Error: {str(e)}"
+        tool.__wrapped__(**kwargs)
+    except Exception:
+        pass # nothing to warm; the tool call will report the error
 
 if __name__ == "__main__":
+    # request the common first calls in the background while the server starts, each on its own thread so they overlap, and
+    # the first real tool calls find the responses already cached instead of waiting on stats.nba.com
+    for tool, kwargs in _warm_calls():
+        threading.Thread(target=_warm_cache, args=(tool, kwargs), name=f"warm-{tool.__name__}", daemon=True).start()
     mcp.run()
 
 """
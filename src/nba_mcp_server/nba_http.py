@@ -0,0 +1,132 @@
+import datetime
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from nba_api.stats.library.http import NBAStatsHTTP, NBAStatsResponse
+
+# stats.nba.com is slow (often several seconds to first byte) and most of what we ask it for doesn't change, so every GET
+# nba_api makes goes through a small sqlite-backed response cache. How long a response stays fresh depends on what it is:
+LIVE_TTL = 60 # scoreboards, play-by-play, standings and box scores for the current season can change mid-game
+DEFAULT_TTL = 60 * 60 # current season stats only move once games finish
+HISTORICAL_TTL = 30 * 24 * 60 * 60 # past seasons are final
+LIVE_ENDPOINT_PREFIXES = (
+    "scoreboard", "playbyplay", "winprobability", "leaguestandings", "playoffpicture", "iststandings", "video", "boxscore",
+    "gamerotation", "hustlestatsboxscore"
+)
+# Connection failures and throttling/gateway errors from stats.nba.com are usually gone a moment later, so the session retries
+# them with a short backoff (honouring Retry-After on a 429). Read timeouts aren't retried: the request already waited out
+# nba_api's full timeout, and doing that again would just triple the wait before the tool reports the error.
+RETRY = Retry(
+    total=3, connect=3, read=0, status=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}), raise_on_status=False
+)
+CACHE_PATH = Path(os.getenv("NBA_CHAT_CACHE_DIR", Path.home() / ".cache" / "nba_chat")) / "nba_http.sqlite"
+
+def _season_start_year(today: datetime.date) -> int:
+    return today.year if today.month >= 10 else today.year - 1
+
+def _is_past_season(params: dict) -> bool:
+    """True when the request is pinned to a season (or a game from a season) that has already finished."""
+    current = _season_start_year(datetime.date.today())
+    season = params.get("Season") or params.get("SeasonYear")
+    if season and str(season)[:4].isdigit():
+        return int(str(season)[:4]) < current
+    game_id = str(params.get("GameID") or "")
+    if len(game_id) == 10 and game_id[3:5].isdigit(): # e.g. 0022400061 is from the 2024-25 season
+        return 2000 + int(game_id[3:5]) < current
+    return False
+
+def response_ttl(url: str, params: dict) -> float:
+    """Seconds a stats.nba.com response can be served from the cache."""
+    if _is_past_season(params):
+        return HISTORICAL_TTL
+    endpoint = url.rstrip("/").rsplit("/", 1)[-1].lower()
+    if endpoint.startswith(LIVE_ENDPOINT_PREFIXES):
+        return LIVE_TTL
+    return DEFAULT_TTL
+
+
+class CachedSession(requests.Session):
+    """
+    requests.Session that answers GETs from an on-disk cache while they're fresh, keyed on the url and its (sorted) query
+    params. Only successful responses are stored. Any problem with the cache file just means going to the network.
+    Installed as nba_api's session, so it's also the one connection pool all stats requests share.
+    """
+    def __init__(self, path: Path = CACHE_PATH):
+        super().__init__()
+        # one keep-alive pool shared by every endpoint, sized for the concurrent fetches the tools and match analysis make, so
+        # requests after the first reuse a warm TLS connection to stats.nba.com instead of handshaking again
+        self.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=RETRY))
+        self._lock = threading.Lock()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, url TEXT, status INTEGER, body TEXT, expires REAL)"
+            )
+        except sqlite3.Error:
+            self._db = None
+
+    def _lookup(self, key: str):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, status, body FROM responses WHERE key = ? AND expires > ?", (key, time.time())
+            ).fetchone()
+        if row is None:
+            return None
+        response = requests.Response()
+        response.url, response.status_code, response._content = row[0], row[1], row[2].encode()
+        response.encoding = "utf-8"
+        return response
+
+    def _store(self, key: str, response: requests.Response, ttl: float):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, response.url, response.status_code, response.text, time.time() + ttl)
+            )
+
+    def request(self, method, url, params=None, **kwargs):
+        if self._db is None or method.upper() != "GET":
+            return super().request(method, url, params=params, **kwargs)
+
+        params = dict(params or {})
+        key = hashlib.blake2b(repr((url, sorted(params.items()))).encode(), digest_size=16).hexdigest()
+        try:
+            cached = self._lookup(key)
+        except sqlite3.Error:
+            cached = None
+        if cached is not None:
+            return cached
+
+        response = super().request(method, url, params=params, **kwargs)
+        if response.status_code == 200:
+            try:
+                self._store(key, response, response_ttl(url, params))
+            except sqlite3.Error:
+                pass
+        return response
+
+
+class OrjsonStatsResponse(NBAStatsResponse):
+    """
+    nba_api's stats response, parsed with orjson instead of the stdlib json module. Every endpoint builds its datasets from
+    get_dict(), and the bodies are large (a season of game logs is several MB), so parsing is most of the local work per request.
+    """
+    def get_dict(self):
+        return orjson.loads(self._response)
+
+
+def install_cache():
+    """Route nba_api's stats requests through the response cache, and parse the responses with orjson."""
+    NBAStatsHTTP._session = CachedSession() # nba_api sends every stats request through NBAStatsHTTP.get_session()
+    NBAStatsHTTP.nba_response = OrjsonStatsResponse # and wraps each body in NBAStatsHTTP.nba_response
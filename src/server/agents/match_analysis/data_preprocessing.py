@@ -1,5 +1,7 @@
 import pandas as pd
 import numpy as np
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from nba_api.stats.endpoints import leaguegamefinder, boxscoretraditionalv3, boxscoreadvancedv3
 from nba_mcp_server.mcp_server import get_current_season, find_team_id
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -13,6 +15,19 @@ wait_mult = 5
 wait_min = 1
 wait_max = 120
 wait_attempts =10
+# Max box score requests in flight at once when pulling a whole season of games. Each request is almost entirely waiting on
+# stats.nba.com, so a handful of threads gives a near-linear speedup; going much wider just gets us throttled.
+max_fetch_workers = 8
+
+def _map_games(fn, game_ids):
+    """
+    fn(game_id) for each game id, run concurrently; results come back in the same order as game_ids.
+    Each call runs in a copy of the caller's context so retries are still logged to the active log file.
+    """
+    with ThreadPoolExecutor(max_workers=max_fetch_workers) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, fn, game_id) for game_id in game_ids]
+        return [future.result() for future in futures]
+
 @retry(stop=stop_after_attempt(wait_attempts), wait=wait_exponential(multiplier=wait_mult, min=wait_min, max=wait_max), before_sleep=log_retry_attempt)
 def _get_box_advanced(game_id, team_id, columns, type):
     box_advanced = boxscoreadvancedv3.BoxScoreAdvancedV3(game_id=game_id)
@@ -50,15 +65,15 @@ def _get_team_performance_data(team_name):
     game_record_columns = ["GAME_ID", "GAME_DATE","MATCHUP", "WL", "PTS", "FG_PCT", "FG3_PCT", "REB"]
     box_advanced_columns = ["offensiveRating", "defensiveRating", "netRating", "effectiveFieldGoalPercentage","trueShootingPercentage","pace","assistPercentage", "turnoverRatio"]
 
-    team_data = []
     # for each game pull the target data from the boxscore api calls
-    for _,row in game_record.iterrows():
-        game_id = row.GAME_ID
-        game_record_data = row[game_record_columns].values
-
-        box_advanced = _get_box_advanced(game_id, team_id, box_advanced_columns, "T").values[0]
+    box_advanced = _map_games(
+        lambda game_id: _get_box_advanced(game_id, team_id, box_advanced_columns, "T").values[0], game_record.GAME_ID
+    )
 
-        team_data.append(np.concat([game_record_data, box_advanced]))
+    team_data = []
+    for (_,row), box_advanced_row in zip(game_record.iterrows(), box_advanced):
+        game_record_data = row[game_record_columns].values
+        team_data.append(np.concat([game_record_data, box_advanced_row]))
 
     return pd.DataFrame(team_data, columns = game_record_columns + box_advanced_columns)
 
@@ -143,8 +158,8 @@ def _get_player_performance(team_name: str):
     game_record = game_record[["GAME_ID","GAME_DATE","MATCHUP","WL"]]
     player_data = {}
 
-    for _, row in game_record.iterrows():
-        game_data = _get_player_game_data(row['GAME_ID'], team_id)
+    game_datas = _map_games(lambda game_id: _get_player_game_data(game_id, team_id), game_record['GAME_ID'])
+    for (_, row), game_data in zip(game_record.iterrows(), game_datas):
         for _, player_row in game_data.iterrows():
             player_slug = player_row['playerSlug']
             
@@ -1,6 +1,8 @@
 from typing import List, Any, Callable, Union
 
 class agent_config:
+    __slots__ = ("name", "model", "system_prompt", "tools", "depends_on")
+
     def __init__(self, 
                  name: str, 
                  model: Any, 
@@ -14,6 +16,8 @@ class agent_config:
         self.depends_on = depends_on if depends_on is not None else []
 
 class function_config():
+    __slots__ = ("name", "function")
+
     def __init__(self, name: str, function: Callable):
         self.name = name
         self.function = function
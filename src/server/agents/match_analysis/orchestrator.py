@@ -154,8 +154,11 @@ class GraphExecutor:
             active_log_path.reset(token)
 
     async def _run_function(self, cfg: function_config, context: Dict):
-        # Functions currently only use global context
-        return call_function(cfg.function, context['team1'], context['team2'], context['game_date'])
+        # Functions currently only use global context.
+        # They're blocking nba_api calls, so run them in a thread: sibling function nodes gathered above then fetch
+        # concurrently instead of one after another on the event loop. to_thread copies the context, so the node's
+        # active log path carries over.
+        return await asyncio.to_thread(call_function, cfg.function, context['team1'], context['team2'], context['game_date'])
 
     async def _run_agent(self, cfg: agent_config, context: Dict, dep_results: Dict, log_path: str):
         # 1. Determine which critic to use
@@ -8,12 +8,12 @@ from sqlalchemy import text
 from mcp.client.session import ClientSession
 from mcp.client.stdio import stdio_client, StdioServerParameters
 from server.openai_client import OpenAIClient
+from server.tool_cache import list_tools_cached
 from server.agents import chat_agent
 from server.agents.match_analysis import orchestrator
 import sys
 from pydantic import BaseModel
 from typing import Optional
-import asyncio
 from datetime import datetime
 from dotenv import load_dotenv
 import os
@@ -71,24 +71,20 @@ async def lifespan(app: FastAPI):
         ClientSession(perp_read, perp_write) as perp_session
     ):
         # Initialize all mcp sessions:
-        await nba_session.initialize()
-        await perp_session.initialize()
+        nba_init = await nba_session.initialize()
+        perp_init = await perp_session.initialize()
         print("✓ MCP servers initialized")
         
-        # Get tools
-        nba_tool_list = await nba_session.list_tools()
-        perp_tool_list = await perp_session.list_tools()
-
-        nba_tools = nba_tool_list.tools
-        persistent_tools = perp_tool_list.tools 
+        # Get tools (from the on-disk cache when the servers haven't changed)
+        nba_tools = await list_tools_cached(nba_session, nba_params, nba_init.serverInfo.version)
+        persistent_tools = await list_tools_cached(perp_session, perplexity_params, perp_init.serverInfo.version)
 
         # Store sessions
         mcp_sessions["nba"] = nba_session
         mcp_sessions["perplexity"] = perp_session
 
         # Create clients
-        mcp_lock = asyncio.Lock()
-        chat_client = OpenAIClient(mcp_sessions, nba_tools, persistent_tools, mcp_lock, chat_agent.MODEL, chat_agent.SYSTEM_PROMPT)
+        chat_client = OpenAIClient(mcp_sessions, nba_tools, persistent_tools, chat_agent.MODEL, chat_agent.SYSTEM_PROMPT)
         connection_manager = ConnectionManager()
 
         # Store in app state
@@ -99,6 +95,8 @@ async def lifespan(app: FastAPI):
         app.state.connection_manager = connection_manager
         
         yield # server runs here
+
+        await chat_client.aclose()
     
     # MCP cleanup happens automatically when exiting the context managers
     print("✓ MCP server shutdown")
@@ -153,14 +151,51 @@ async def websocket_endpoint(websocket: WebSocket, chat_id: str):
     except WebSocketDisconnect:
         await app.state.connection_manager.disconnect(chat_id, websocket)
 
+# chat_id -> whether more messages arrived while that chat's reply was being generated. A chat is only in here while a reply
+# for it is in flight.
+_replies_in_flight = {}
+
 async def generate_assistant_reply(chat_id: str, chat_client, connection_manager):
-    """Background task to generate assistant reply."""
+    """Background task to generate assistant reply.
+
+    Replies are coalesced per chat: if one is already being generated, messages that come in meanwhile are answered together
+    by a single follow-up reply once it lands, instead of each starting its own overlapping tool-calling loop.
+    """
+    if chat_id in _replies_in_flight:
+        _replies_in_flight[chat_id] = True # the in-flight reply will go around once more and pick this message up
+        return
+
+    _replies_in_flight[chat_id] = False
+    answered = None
+    try:
+        while True:
+            # if this reply fails, answered is None and a follow-up for queued messages answers the whole history instead
+            answered = await _reply_once(chat_id, connection_manager, answered)
+            if not _replies_in_flight[chat_id]:
+                break
+            _replies_in_flight[chat_id] = False
+    finally:
+        del _replies_in_flight[chat_id]
+
+async def _reply_once(chat_id: str, connection_manager, answered: Optional[tuple] = None) -> Optional[tuple]:
+    """
+    Generate, store and push one assistant reply. answered is what the previous call returned when this is a follow-up: the
+    ids of the messages that reply covered, in order, and the reply's own id. Returns the same for this reply, or None if it
+    failed.
+    """
     try:
         # Get chat metadata (includes report_id)
         chat = get_chat(chat_id)
 
         # Get full message history
         messages = get_chat_messages(chat_id)
+        if answered:
+            # the previous reply was stored after the messages that arrived while it was generating, so move it back in front
+            # of them; they then read as the open questions for this reply
+            covered_ids, reply_id = answered
+            by_id = {msg["id"]: msg for msg in messages}
+            seen = set(covered_ids) | {reply_id}
+            messages = [by_id[i] for i in (*covered_ids, reply_id)] + [msg for msg in messages if msg["id"] not in seen]
         history = [{"role": msg["role"], "content": msg["content"]} for msg in messages] 
 
         # If chat is linked to a report, prepend report as system context
@@ -176,11 +211,10 @@ async def generate_assistant_reply(chat_id: str, chat_client, connection_manager
         assistant_reply = await app.state.chat_client.get_completion(history)
 
         # insert the assistant message into the chat history
-        insert_message(chat_id, "assistant", assistant_reply, None)
+        assistant_id = insert_message(chat_id, "assistant", assistant_reply, None)
 
         # Get the assistant message we just inserted
-        messages = get_chat_messages(chat_id)
-        assistant_msg = messages[-1]
+        assistant_msg = next(msg for msg in get_chat_messages(chat_id) if msg["id"] == assistant_id)
         
         # Push message_created event for assistant message
         await connection_manager.send_to_chat(chat_id, {
@@ -193,8 +227,10 @@ async def generate_assistant_reply(chat_id: str, chat_client, connection_manager
                 "created_at": assistant_msg["created_at"].isoformat()
             }
         })
+        return [msg["id"] for msg in messages], assistant_id
     except Exception as e:
         print(f"Error generating assistant reply for chat {chat_id}: {e}")
+        return None
 
 
 @app.post("/chat")
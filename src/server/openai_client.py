@@ -1,9 +1,95 @@
-import anyio
+import asyncio
 import os
-import json
+import orjson
 from typing import List, Dict
-from openai import OpenAI
-from nba_mcp_server.mcp_server import ToolCategory
+import httpx
+from hashlib import blake2b
+from cachetools import TLRUCache
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from mcp.types import TextContent
+from nba_mcp_server.mcp_server import ToolCategory, get_current_season
+
+# Tool results are cached in-process, keyed by tool name + arguments, so a conversation that keeps re-deriving the same stat
+# doesn't pay for an MCP + stats.nba.com round-trip every time. How long a result stays valid depends on the tool:
+TOOL_CACHE_TTL = 10 * 60 # default for stats that only move once games finish
+LIVE_TOOL_CACHE_TTL = 60 # tools that change during games (the server tags them 'live' in their meta)
+HISTORICAL_TOOL_CACHE_TTL = 24 * 60 * 60 # past seasons are final
+
+# Large tool outputs (full box scores, season logs, ...) are swapped out of the conversation: the model gets a short preview plus
+# a ref, and can pull the full output with fetch_stored_result if it actually needs it. Otherwise every later request in the
+# tool-calling loop would re-upload the whole table.
+STORED_RESULT_THRESHOLD = 8 * 1024 # characters of serialized payload
+STORED_RESULT_PREVIEW_LINES = 25
+FETCH_STORED_RESULT = "fetch_stored_result"
+FETCH_STORED_RESULT_TOOL = {
+    "type": "function",
+    "function": {
+        "name": FETCH_STORED_RESULT,
+        "description": "Get the full output of an earlier tool call that was too large to include inline. "
+                       "Only call this if the preview you were given doesn't contain what you need.",
+        "parameters": {
+            "type": "object",
+            "properties": {"ref": {"type": "string", "description": "The stored_ref returned in place of the tool output."}},
+            "required": ["ref"]
+        }
+    }
+}
+
+# Tool outputs the model has already had a few rounds to work through are elided from the messages we keep re-sending. They
+# stay in the stored results, so the stub still points at a ref the model can fetch if it needs to look again.
+STALE_TOOL_ROUNDS = 2
+
+# Category tools the model loaded but hasn't called for this many rounds are taken back out of the tool list, so their schemas
+# stop being billed as prompt tokens on every request. get_tools_by_category is always there to load them again.
+TOOL_IDLE_ROUNDS = 2
+
+def dumps(obj) -> str:
+    """JSON-encode a tool payload to str. orjson is several times faster than json.dumps on the big stat tables."""
+    return orjson.dumps(obj).decode()
+
+def offload_tool_result(stored_results: dict, ref: str, payload: dict, content: str) -> str:
+    """Stash a large tool payload under ref and return the compact stand-in to put in the conversation instead."""
+    stored_results[ref] = payload
+    text = payload.get("result") if isinstance(payload.get("result"), str) else content
+    return dumps({
+        "stored_ref": ref,
+        "size": len(content),
+        "preview": "\n".join(text.splitlines()[:STORED_RESULT_PREVIEW_LINES]),
+        "note": f"Output truncated. Call {FETCH_STORED_RESULT} with this ref for the full result."
+    })
+
+def tool_categories(tool) -> List[str]:
+    """The categories an nba tool is tagged with in its meta (e.g. ['game', 'live']); [] for tools without any."""
+    return tool.meta.get("category", []) if hasattr(tool, "meta") and tool.meta else []
+
+def tool_cache_ttl(session_name: str, live: bool, args: dict) -> float:
+    """Seconds a tool result can be reused for; 0 means never cache it."""
+    if session_name != "nba":
+        return 0 # web search results are neither deterministic nor cheap to be wrong about
+    if live:
+        return LIVE_TOOL_CACHE_TTL
+    season = args.get("season")
+    if season and season != get_current_season():
+        return HISTORICAL_TOOL_CACHE_TTL
+    return TOOL_CACHE_TTL
+
+def tool_cache_key(fn: str, args: dict) -> str:
+    canonical_args = orjson.dumps(args, option=orjson.OPT_SORT_KEYS)
+    return blake2b(fn.encode() + b":" + canonical_args, digest_size=16).hexdigest()
+
+def batch_user_questions(messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    Fold a trailing run of user messages (several questions sent before the assistant got to answer) into one numbered
+    message, so they're answered together in a single tool-calling loop that can fan out all the needed tool calls at once.
+    """
+    start = len(messages)
+    while start > 0 and messages[start - 1]["role"] == "user":
+        start -= 1
+    questions = [m["content"] for m in messages[start:]]
+    if len(questions) < 2:
+        return messages
+    numbered = "\n".join(f"{i}) {q}" for i, q in enumerate(questions, 1))
+    return messages[:start] + [{"role": "user", "content": f"Answer each of the following, using tools as needed:\n{numbered}"}]
 
 def mcp_tools_to_openai_tools(mcp_tools):
     """Convert MCP Tool[] -> OpenAI tools[] (function) schema."""
@@ -20,15 +106,27 @@ def mcp_tools_to_openai_tools(mcp_tools):
     return tools
 
 class OpenAIClient:
-    def __init__(self, mcp_sessions, nba_tools, persistent_tools, mcp_lock, model: str, system_prompt: str):
+    def __init__(self, mcp_sessions, nba_tools, persistent_tools, model: str, system_prompt: str):
         self.mcp_session = mcp_sessions
-        self.mcp_lock = mcp_lock
         self.model = model
         self.system_prompt = system_prompt
-        self.client = OpenAI(
+        # built once and sent as the first message on every request, so each request in a conversation starts with the same
+        # prefix. cache_control marks it for providers that need an explicit prompt-caching breakpoint (openrouter passes it
+        # on to anthropic/gemini); openai models cache a repeated prefix on their own.
+        self.system_message = {
+            "role": "system",
+            "content": [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+        }
+        # async client so the model round-trip doesn't hold up the event loop (and the MCP traffic running on it).
+        # It owns one long-lived connection pool for the whole process, so each turn of the tool-calling loop reuses a
+        # warm keep-alive connection to openrouter instead of paying for a fresh TCP + TLS handshake.
+        self.client = AsyncOpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=os.environ.get("OPENROUTER_API_KEY"),
-            timeout=90.0
+            timeout=90.0,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=100, keepalive_expiry=60.0)
+            )
         )
 
         # since we have multiple mcp sessions, we need to map each tool to its respective session. This way, when the ai
@@ -38,13 +136,18 @@ class OpenAIClient:
             self.tool_to_session[tool.name] = "nba"
         for tool in persistent_tools:
             self.tool_to_session[tool.name] = "perplexity"
+        # tools whose results change during games, taken from the server's own tagging so the two never disagree
+        self.live_tools = {tool.name for tool in nba_tools if "live" in tool_categories(tool)}
+
+        # cached values are (ttl, payload) pairs so each entry can carry its own expiry
+        self.tool_cache = TLRUCache(maxsize=1024, ttu=lambda _key, value, now: now + value[0])
 
-        self.persistent_tools_openai = mcp_tools_to_openai_tools(persistent_tools)
+        # fetch_stored_result is served locally rather than by an mcp server, but it's always available like the persistent tools
+        self.persistent_tools_openai = mcp_tools_to_openai_tools(persistent_tools) + [FETCH_STORED_RESULT_TOOL]
         # we bin tools by category as a lazy-loading/hierarchical loading mechanism. This will reduce context bloat.
         self.nba_tools_by_category = {}
         for tool in nba_tools:
-            categories = tool.meta.get("category", []) if hasattr(tool, "meta") and tool.meta else []
-            for cat in categories:
+            for cat in tool_categories(tool):
                 if cat not in ToolCategory:
                     continue # skip minor categories; we're just using the major sorting categories for now 
                 if cat not in self.nba_tools_by_category:
@@ -53,6 +156,14 @@ class OpenAIClient:
         # convert tools to openai's specific formatting
         for category, tools in self.nba_tools_by_category.items():
             self.nba_tools_by_category[category] = mcp_tools_to_openai_tools(tools)
+        self.base_tool_names = {tool["function"]["name"] for tool in self.nba_tools_by_category["base"]}
+        self.nba_tools_by_name = {
+            tool["function"]["name"]: tool for tools in self.nba_tools_by_category.values() for tool in tools
+        }
+
+    async def aclose(self):
+        """Close the underlying HTTP connection pool."""
+        await self.client.close()
 
     def get_tool_subset(self, categories: List[str]):
         seen = set()
@@ -64,55 +175,158 @@ class OpenAIClient:
                     seen.add(tool["function"]["name"])
         return new_tools
     
+    def get_active_tools(self, loaded_tools: Dict[str, int], round_no: int):
+        """The tools to offer this round: base tools, the persistent tools, and loaded tools that haven't gone idle."""
+        active = [
+            self.nba_tools_by_name[name] for name, last_round in loaded_tools.items()
+            if round_no - last_round < TOOL_IDLE_ROUNDS
+        ]
+        # the fixed tools go first and the ones that come and go last, so the start of the tool list (which providers put in
+        # the prompt ahead of the messages) stays identical between requests and stays cacheable
+        return self.nba_tools_by_category["base"] + self.persistent_tools_openai + active
+
+    async def call_tool(self, fn: str, args: dict) -> dict:
+        """Run a tool through its MCP session and return its payload, reusing a cached result when there is one."""
+        session_name = self.tool_to_session[fn]
+        key = tool_cache_key(fn, args)
+        cached = self.tool_cache.get(key)
+        if cached is not None:
+            return cached[1]
+
+        # no lock needed here: the mcp ClientSession tags each request with an id and multiplexes them over the stdio stream
+        result = await self.mcp_session[session_name].call_tool(fn, args)
+
+        # only TextContent blocks carry text; images/audio/resources are skipped
+        payload = result.structuredContent or {
+            "result": "\n".join([c.text for c in result.content if isinstance(c, TextContent)])
+        }
+
+        # the nba tools report failures as plain "Error: ..." strings, those shouldn't stick around
+        failed = result.isError or str(payload.get("result", "")).startswith("Error")
+        ttl = tool_cache_ttl(session_name, fn in self.live_tools, args)
+        if ttl > 0 and not failed:
+            self.tool_cache[key] = (ttl, payload)
+        return payload
+
+    async def dispatch_tool_call(self, call: dict, stored_results: dict) -> dict:
+        """Run one tool call from the model, either locally (stored results) or through mcp."""
+        function = call["function"]
+        fn = function["name"]
+        args = orjson.loads(function["arguments"] or "{}")
+        if fn == FETCH_STORED_RESULT:
+            return stored_results.get(args.get("ref"), {"result": f"No stored result with ref {args.get('ref')!r}."})
+        return await self.call_tool(fn, args)
+
+    async def stream_completion(self, messages: List[dict], tools: List[dict], stored_results: dict):
+        """
+        Stream one model response. Each tool call is dispatched as soon as it has been fully received (i.e. once the stream
+        moves on to the next call), so the first tools are already running while the rest of the response generates.
+        Returns the assistant message, as a dict ready to append to the messages, and the tool call tasks in call order.
+        """
+        stream = await self.client.chat.completions.create(model=self.model, messages=messages, tools=tools, stream=True)
+        content = []
+        tool_calls = {} # index -> tool call, filled in as its deltas arrive
+        tasks = {}
+
+        def dispatch_received():
+            for index, call in tool_calls.items():
+                if index not in tasks:
+                    tasks[index] = asyncio.create_task(self.dispatch_tool_call(call, stored_results))
+
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue # e.g. the trailing usage chunk
+                delta = chunk.choices[0].delta
+                if delta.content:
+                    content.append(delta.content)
+                for tc in delta.tool_calls or ():
+                    if tc.index not in tool_calls:
+                        dispatch_received() # a new call starting means the ones before it are complete
+                        tool_calls[tc.index] = {"id": tc.id, "type": "function", "function": {"name": "", "arguments": ""}}
+                    call = tool_calls[tc.index]
+                    if tc.id:
+                        call["id"] = tc.id
+                    if tc.function and tc.function.name:
+                        call["function"]["name"] = tc.function.name
+                    if tc.function and tc.function.arguments:
+                        call["function"]["arguments"] += tc.function.arguments
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        dispatch_received()
+
+        order = sorted(tool_calls)
+        # Only the fields the API reads back are kept (no model_dump() of a whole pydantic message).
+        message = {"role": "assistant", "content": "".join(content) or None}
+        if order:
+            message["tool_calls"] = [tool_calls[i] for i in order]
+        return message, [tasks[i] for i in order]
+
     async def get_completion(self, messages: List[Dict[str, str]]) -> str:
         """Get OpenAI completion for message history."""
-        full_messages = [{"role": "system", "content": self.system_prompt}] + messages # attach full message history whenever we send a new message
+        full_messages = [self.system_message] + batch_user_questions(messages) # attach full message history whenever we send a new message
         current_tools = self.nba_tools_by_category["base"] + self.persistent_tools_openai # the LLM starts off with access to just the basic tools
+        stored_results = {} # large tool outputs that were swapped out of full_messages, by ref (the tool call id)
+        # bound once up front, these get hit for every tool call in every round of the loop below
+        append_message = full_messages.append
+        stream_completion = self.stream_completion
+        tool_rounds = [] # (message, payload) pairs for each round of tool results, oldest first
+        loaded_tools = {} # non-base nba tools the model has loaded -> the round they were last loaded or called in
         # the loop below is a tool-calling loop. Basically we just keep calling the API until it's done calling tools. The final response 
         # represents its aggregated knowledge from the tool calls.
         while True:
             try:
-                response = await anyio.to_thread.run_sync(
-                    lambda: self.client.chat.completions.create(
-                        model=self.model,
-                        messages=full_messages,
-                        tools=current_tools
-                    )
-                )
+                msg, tool_tasks = await stream_completion(full_messages, current_tools, stored_results)
             except Exception as e:
                 print("OpenRouter error:", repr(e))
                 raise
             
-            msg = response.choices[0].message
             # note that this is just appending to the internal message loop; we don't touch the database message history here
-            full_messages.append(msg.model_dump())
+            append_message(msg)
             
-            if getattr(msg, "tool_calls", None): # if there are tool calls, send them to the MCP server for execution.
-                for call in msg.tool_calls:
-                    fn = call.function.name
-                    args = json.loads(call.function.arguments or "{}")
-                    
-                    async with self.mcp_lock:
-                        session_name = self.tool_to_session[fn]
-                        session = self.mcp_session[session_name]
-                        result = await session.call_tool(fn, args)
-
-                    payload = result.structuredContent or {
-                            "result": "\n".join(
-                                c.text for c in result.content if getattr(c, "text", None)
-                            )
-                        }
+            tool_calls = msg.get("tool_calls")
+            if tool_calls: # if there are tool calls, they were sent to the MCP server for execution while the response streamed.
+                # the calls within one response are independent, so they run concurrently; handle the results in order
+                payloads = await asyncio.gather(*tool_tasks)
+                tool_round = []
+                round_no = len(tool_rounds) + 1
+                for call, payload in zip(tool_calls, payloads):
+                    fn = call["function"]["name"]
                     # we treat get_tools_by_category uniquely. Rather than returning a message to the LLM, we just updated the 
                     # set of current_tools we're supplying to the LLM. 
                     if fn == "get_tools_by_category": 
-                        categories = json.loads(json.dumps(payload)).get("result", [])
-                        current_tools = self.get_tool_subset(categories) + self.persistent_tools_openai
-                        full_messages.append({"role": "tool", "tool_call_id": call.id, "content": "Updated tool set."})
+                        categories = payload.get("result", [])
+                        for tool in self.get_tool_subset(categories):
+                            name = tool["function"]["name"]
+                            if name not in self.base_tool_names:
+                                loaded_tools[name] = round_no
+                        append_message({"role": "tool", "tool_call_id": call["id"], "content": "Updated tool set."})
                     else: # its a normal tool call, just append the result to the full_message 
-                        full_messages.append({"role": "tool", "tool_call_id": call.id, "content": json.dumps(payload)})
+                        if fn in loaded_tools:
+                            loaded_tools[fn] = round_no
+                        content = dumps(payload)
+                        if fn != FETCH_STORED_RESULT and len(content) > STORED_RESULT_THRESHOLD:
+                            content = offload_tool_result(stored_results, call["id"], payload, content)
+                        tool_message = {"role": "tool", "tool_call_id": call["id"], "content": content}
+                        append_message(tool_message)
+                        # fetched results age out like any other; the stub's ref (this call's id) still leads back to them
+                        tool_round.append((tool_message, payload))
+
+                current_tools = self.get_active_tools(loaded_tools, round_no)
+
+                # once a round's results are STALE_TOOL_ROUNDS rounds old, the model has already used them; swap them for a stub.
+                # tool_call_id stays so every assistant tool call still has its matching tool message.
+                tool_rounds.append(tool_round)
+                if len(tool_rounds) > STALE_TOOL_ROUNDS:
+                    for tool_message, payload in tool_rounds[-STALE_TOOL_ROUNDS - 1]:
+                        ref = tool_message["tool_call_id"]
+                        stored_results.setdefault(ref, payload)
+                        tool_message["content"] = f"<elided: earlier result, call {FETCH_STORED_RESULT} with ref {ref!r} to see it again>"
                 
                 continue # the tool message has just been appended, and now the AI needs to process it, so we continue 
             
             break # no more tool calls means the AI is done processing
         
-        return msg.content
+        return msg["content"]
@@ -0,0 +1,51 @@
+import hashlib
+import importlib.util
+import json
+import os
+import time
+from pathlib import Path
+from typing import List
+from mcp.client.session import ClientSession
+from mcp.client.stdio import StdioServerParameters
+from mcp.types import Tool
+
+# The tool list an MCP server advertises only changes when the server itself changes, so we keep a copy on disk and skip the
+# list_tools() round-trip on restarts. Entries are keyed by the server's command line plus the version it reports in
+# initialize(), and expire after TOOLS_CACHE_TTL seconds (set it to 0 to always refetch). For a server run from a local module
+# (python -m ...) the reported version is the mcp SDK's, so the key also includes a digest of that module's source: editing a
+# tool's signature or docstring changes its schema, and that must not be hidden behind the cache.
+CACHE_DIR = Path(os.getenv("NBA_CHAT_CACHE_DIR", Path.home() / ".cache" / "nba_chat"))
+TOOLS_CACHE_TTL = float(os.getenv("TOOLS_CACHE_TTL", 3600))
+
+def _source_digest(params: StdioServerParameters) -> str:
+    """Digest of the module a `python -m module` server runs, or "" for any other server (or if it can't be read)."""
+    args = list(params.args)
+    if "-m" not in args or args.index("-m") + 1 >= len(args):
+        return ""
+    try:
+        spec = importlib.util.find_spec(args[args.index("-m") + 1])
+        return hashlib.blake2b(Path(spec.origin).read_bytes(), digest_size=16).hexdigest()
+    except (ImportError, ValueError, AttributeError, TypeError, OSError):
+        return ""
+
+def _cache_path(params: StdioServerParameters, server_version: str) -> Path:
+    key = json.dumps([params.command, params.args, server_version, _source_digest(params)])
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return CACHE_DIR / f"tools_{digest}.json"
+
+async def list_tools_cached(session: ClientSession, params: StdioServerParameters, server_version: str) -> List[Tool]:
+    """Get the tools exposed by an MCP session, served from the on-disk cache when it's still fresh."""
+    path = _cache_path(params, server_version)
+    try:
+        if time.time() - path.stat().st_mtime < TOOLS_CACHE_TTL:
+            return [Tool.model_validate(t) for t in json.loads(path.read_text())]
+    except (OSError, ValueError):
+        pass # missing or unreadable cache, just refetch below
+
+    tools = (await session.list_tools()).tools
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps([t.model_dump(mode="json", by_alias=True, exclude_none=True) for t in tools]))
+    except OSError as e:
+        print(f"Could not write tool cache {path}: {e}")
+    return tools
@@ -0,0 +1,25 @@
+import pandas as pd
+
+from nba_mcp_server.formatting import fast_md
+
+
+def test_all_null_object_column_renders_blank_cells():
+    df = pd.DataFrame({"Z": [None, None], "TEAM": ["BOS", "NYK"]})
+    assert fast_md(df) == "| Z | TEAM |\n|---|---|\n|  | BOS |\n|  | NYK |"
+
+
+def test_list_valued_column_renders_its_cells_as_text():
+    df = pd.DataFrame({"PLAYERS": [["Tatum", "Brown"], None, {"id": 1}], "TEAM": ["BOS", "NYK", "MIA|X"]})
+    assert fast_md(df) == (
+        "| PLAYERS | TEAM |\n|---|---|\n| ['Tatum', 'Brown'] | BOS |\n|  | NYK |\n| {'id': 1} | MIA\\|X |"
+    )
+
+
+def test_all_na_nullable_int_column_renders_blank_cells():
+    df = pd.DataFrame({"PTS": pd.array([None, None], dtype="Int64")})
+    assert fast_md(df) == "| PTS |\n|---|\n|  |\n|  |"
+
+
+def test_nullable_int_column_with_some_missing_values():
+    df = pd.DataFrame({"PTS": pd.array([12, None, 7], dtype="Int64")})
+    assert fast_md(df) == "| PTS |\n|---|\n| 12 |\n|  |\n| 7 |"